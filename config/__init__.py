@@ -3,38 +3,12 @@ Configuration package for the followers tracker application.
 
 This package contains configuration modules that provide settings,
 constants, and selectors used throughout the application.
-"""
 
-from config.settings import (
-    # URLs
-    NICOLAS_LKD_PROFILE,
-    LKD_NEWSLETTER,
-    AIFC_LKD_PAGE,
-    BI_LKD_PAGE,
-    NBO_LKD_PAGE,
-    EXCEL_CHEATSHEETS_LKD_PAGE,
-    
-    # API endpoints
-    YOUTUBE_STATS_ENDPOINT,
-    TWITTER_API_ENDPOINT,
-    INSTAGRAM_API_ENDPOINT,
-    KIT_GROWTH_STATS_ENDPOINT,
-    
-    # Form URLs
-    FOLLOWERS_FORM_URL,
-    KIT_STATS_FORM_URL,
-    
-    # Path settings
-    LOG_FILE_PATH,
-    
-    # Environment settings
-    ENV_FILE_PATH,
-    
-    # Other settings
-    DEFAULT_TIMEOUT,
-    MAX_RETRIES
-)
+The names listed in ``__all__`` are forwarded to ``config.settings`` on
+first access, so importing the package does not load the settings module.
+"""
 
+import importlib
 
 
 __all__ = [
@@ -45,30 +19,43 @@ __all__ = [
     'BI_LKD_PAGE',
     'NBO_LKD_PAGE',
     'EXCEL_CHEATSHEETS_LKD_PAGE',
-    
+
     # API endpoints
-    'YOUTUBE_STATS_ENDPOINT',
+    'youtube_stats_endpoint',
     'TWITTER_API_ENDPOINT',
     'INSTAGRAM_API_ENDPOINT',
     'KIT_GROWTH_STATS_ENDPOINT',
-    
+
     # Form URLs
     'FOLLOWERS_FORM_URL',
     'KIT_STATS_FORM_URL',
-    
+
     # Path settings
-    'COOKIES_FILE_PATH',
     'LOG_FILE_PATH',
-    
+
     # Environment settings
     'ENV_FILE_PATH',
-    
+
     # Other settings
     'DEFAULT_TIMEOUT',
-    'MAX_RETRIES',
-    
-    # Selector classes
-    'LinkedInSelectors',
-    'YouTubeSelectors',
-    'TwitterSelectors'
-]
\ No newline at end of file
+    'MAX_RETRIES'
+]
+
+
+def __getattr__(name):
+    """
+    Forward the re-exported names to ``config.settings`` (PEP 562).
+
+    The value is stored in the package namespace, so each name is only
+    forwarded once; later reads are plain attribute lookups.
+    """
+    if name in __all__:
+        settings = importlib.import_module('config.settings')
+        value = getattr(settings, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
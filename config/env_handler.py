@@ -6,6 +6,7 @@ validating their presence, and providing fallbacks.
 """
 
 import os
+import shutil
 import logging
 from typing import Dict, Any, Optional, List, Union
 from dotenv import load_dotenv
@@ -78,11 +79,7 @@ def validate_env_vars(required_vars: List[str]) -> bool:
     Returns:
         True if all required variables are set, False otherwise.
     """
-    missing_vars = []
-    
-    for var_name in required_vars:
-        if os.getenv(var_name) is None:
-            missing_vars.append(var_name)
+    missing_vars = [var_name for var_name in required_vars if var_name not in os.environ]
     
     if missing_vars:
         logger.error(f"Missing required environment variables: {', '.join(missing_vars)}")
@@ -116,12 +113,8 @@ def create_env_file_from_template(template_path: Union[str, Path], output_path:
         # Create parent directories if they don't exist
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
-        # Copy the template content to the new file
-        with template_path.open('r') as template_file:
-            template_content = template_file.read()
-        
-        with output_path.open('w') as output_file:
-            output_file.write(template_content)
+        # Copy the template to the new file without decoding it
+        shutil.copyfile(template_path, output_path)
         
         logger.info(f"Created .env file at {output_path} from template")
         return True
@@ -3,15 +3,22 @@ Central configuration settings for the followers tracker application.
 
 This module contains all the configuration variables used across the application,
 including URLs, API endpoints, paths, and other settings.
+
+Settings that come from the environment are resolved lazily: the .env file is
+only loaded, and each value only read and cast, the first time it is accessed.
 """
 
 import os
+import functools
+import threading
 from pathlib import Path
-from dotenv import load_dotenv
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from config.env_handler import load_env_file
 
 
 ENV_FILE_PATH = os.getenv('ENV_PATH', 'config/.env')
-load_dotenv(ENV_FILE_PATH)
 
 # Base directory of the project
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -32,18 +39,11 @@ INSTAGRAM_USERNAME_AIFC = 'theaifinanceclub'  # AI Finance Club profile
 
 # Twitter settings
 TWITTER_USERNAME = 'bouchernicolas'
-TWITTER_BEARER_TOKEN = os.getenv('TWITTER_BEARER_TOKEN')
-
-# YouTube settings
-YT_CHANNEL_ID = os.getenv('YOUTUBE_CHANNEL_ID')
-YT_API_KEY = os.getenv('YOUTUBE_API_ID')
 
 # Kit settings
-KIT_API_KEY = os.getenv('KIT_V4_API_KEY')
 KIT_GROWTH_STATS_ENDPOINT = "https://api.kit.com/v4/account/growth_stats"
 
 # API endpoints
-YOUTUBE_STATS_ENDPOINT = f'https://www.googleapis.com/youtube/v3/channels?part=statistics&id={YT_CHANNEL_ID}&key={YT_API_KEY}'
 TWITTER_API_ENDPOINT = f"https://api.twitter.com/2/users/by/username/{TWITTER_USERNAME}?user.fields=public_metrics"
 INSTAGRAM_API_ENDPOINT = "https://fanhub.pro/tucktools_user"
 
@@ -51,8 +51,8 @@ INSTAGRAM_API_ENDPOINT = "https://fanhub.pro/tucktools_user"
 FOLLOWERS_FORM_URL = 'https://docs.google.com/forms/d/e/1FAIpQLSeK_A8x_7ipnICGwK3k3MdTq3vGhXwfu9BhSz37Bgz27T1llw/formResponse'
 KIT_STATS_FORM_URL = 'https://docs.google.com/forms/d/e/1FAIpQLSfOM3yefdvcyb3lXFlJqH0ZFUSaQ2lFvUGnDlgt7ELB0-ChMg/formResponse'
 
-# Google Form fields mapping
-FOLLOWERS_FORM_FIELDS = {
+# Google Form fields mapping (read-only)
+FOLLOWERS_FORM_FIELDS = MappingProxyType({
     'Business Infographics': 'entry.1247179473',
     'Nicolas Boucher Online': 'entry.1150066733',
     'AI Finance Club': 'entry.269674828',
@@ -69,9 +69,9 @@ FOLLOWERS_FORM_FIELDS = {
     "Tiktok Likes": "entry.130639733",
     "Threads Followers": "entry.961304919",
     'AI Finance Club Instagram Followers': "entry.95142778"
-}
+})
 
-KIT_STATS_FORM_FIELDS = {
+KIT_STATS_FORM_FIELDS = MappingProxyType({
     "Today's Number of Subs": 'entry.1792758135',
     "Cancellation": 'entry.228306667',
     "Net New Subscribers": 'entry.862964481',
@@ -84,20 +84,116 @@ KIT_STATS_FORM_FIELDS = {
     "Monthly Cancellations": 'entry.759665711',
     "Monthly Net New Subscribers": 'entry.1932265942',
     "Monthly New Subscribers": 'entry.2091527192'
-}
-
-LOG_FILE_PATH = os.getenv('LOG_FILE_PATH', 'logs/followers_tracker.log')
+})
 
 FACEBOOK_URL = "https://www.facebook.com/people/Nicolas-Boucher-Online/61561793581257/"
 
-# Database settings
-DATABASE_URL = os.getenv('DATABASE_URL', 'sqlite:///data/followers_stats.db')
+_TRUE_VALUES = frozenset({'1', 'true', 'yes', 'on'})
+
+
+def _parse_bool(value: str) -> bool:
+    """Parse a boolean environment value ("1", "true", "yes", "on" are true)."""
+    return value.strip().lower() in _TRUE_VALUES
+
 
-# General settings
-DEFAULT_TIMEOUT = int(os.getenv('DEFAULT_TIMEOUT', '30'))  # Default timeout in seconds
-MAX_RETRIES = int(os.getenv('MAX_RETRIES', '3'))  # Default max retries
-HEADLESS_BROWSER = os.getenv('HEADLESS_BROWSER', 'False').lower() == 'false'
+def _parse_int(value: str) -> int:
+    """Parse an integer environment value."""
+    return int(value.strip())
+
+
+# Settings read from the environment, resolved on first access.
+# Maps setting name -> (environment variable, default, cast).
+_ENV_SETTINGS: Dict[str, Tuple[str, Optional[str], Optional[Callable[[str], Any]]]] = {
+    # Twitter settings
+    'TWITTER_BEARER_TOKEN': ('TWITTER_BEARER_TOKEN', None, None),
+
+    # YouTube settings
+    'YT_CHANNEL_ID': ('YOUTUBE_CHANNEL_ID', None, None),
+    'YT_API_KEY': ('YOUTUBE_API_ID', None, None),
+
+    # Kit settings
+    'KIT_API_KEY': ('KIT_V4_API_KEY', None, None),
+
+    # Path settings
+    'LOG_FILE_PATH': ('LOG_FILE_PATH', 'logs/followers_tracker.log', None),
+
+    # Database settings
+    'DATABASE_URL': ('DATABASE_URL', 'sqlite:///data/followers_stats.db', None),
+
+    # General settings
+    'DEFAULT_TIMEOUT': ('DEFAULT_TIMEOUT', '30', _parse_int),  # Default timeout in seconds
+    'MAX_RETRIES': ('MAX_RETRIES', '3', _parse_int),  # Default max retries
+    'HEADLESS_BROWSER': ('HEADLESS_BROWSER', 'True', _parse_bool),
+
+    'SOCIALBLADE_COOKIES_FILE': ('SOCIALBLADE_COOKIES_FILE', str(BASE_DIR / 'Cookies.json'), None),
+    'SOCIALBLADE_HEADLESS': ('SOCIALBLADE_HEADLESS', 'True', _parse_bool),
+    'SOCIALBLADE_TIMEOUT_MS': ('SOCIALBLADE_TIMEOUT_MS', '45000', _parse_int),
+}
 
-SOCIALBLADE_COOKIES_FILE = os.getenv('SOCIALBLADE_COOKIES_FILE', str(BASE_DIR / 'Cookies.json'))
-SOCIALBLADE_HEADLESS = os.getenv('SOCIALBLADE_HEADLESS', 'True').lower() == 'true'
-SOCIALBLADE_TIMEOUT_MS = int(os.getenv('SOCIALBLADE_TIMEOUT_MS', '45000'))
\ No newline at end of file
+_settings_lock = threading.RLock()
+# Plain-dict copy of os.environ taken once the .env file has been loaded
+_env: Optional[Dict[str, str]] = None
+
+
+def _ensure_env_loaded() -> Dict[str, str]:
+    """
+    Load the .env file the first time an environment setting is read.
+
+    Returns:
+        A snapshot of the environment, taken after the .env file was loaded.
+    """
+    global _env
+    if _env is None:
+        load_env_file(ENV_FILE_PATH)
+        _env = dict(os.environ)
+    return _env
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Resolve an environment-backed setting on first access (PEP 562).
+
+    The resolved value is stored in the module globals, so later reads are
+    plain attribute lookups that never reach this function again.
+    """
+    if name not in _ENV_SETTINGS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    with _settings_lock:
+        if name in globals():
+            return globals()[name]
+
+        env = _ensure_env_loaded()
+        env_var, default, cast = _ENV_SETTINGS[name]
+        value = env.get(env_var, default)
+        if cast is not None and value is not None:
+            try:
+                value = cast(value)
+            except ValueError:
+                raise ValueError(f"Invalid value for environment variable {env_var}: {value!r}") from None
+
+        return globals().setdefault(name, value)
+
+
+@functools.lru_cache(maxsize=None)
+def youtube_stats_endpoint() -> str:
+    """
+    Build the YouTube channel statistics endpoint from the environment.
+
+    Returns:
+        The channel statistics URL for the configured channel and API key.
+
+    Raises:
+        ValueError: If YOUTUBE_CHANNEL_ID or YOUTUBE_API_ID is not set.
+    """
+    with _settings_lock:
+        env = _ensure_env_loaded()
+
+    # Read from the same snapshot as every other setting
+    for env_var in ('YOUTUBE_CHANNEL_ID', 'YOUTUBE_API_ID'):
+        if env_var not in env:
+            raise ValueError(f"Required environment variable {env_var} is not set")
+
+    channel_id = env['YOUTUBE_CHANNEL_ID']
+    api_key = env['YOUTUBE_API_ID']
+    return f'https://www.googleapis.com/youtube/v3/channels?part=statistics&id={channel_id}&key={api_key}'
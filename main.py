@@ -10,25 +10,56 @@ import os
 import time
 import logging
 import argparse
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, Any, List, Optional
-
-# Add the project root directory to the Python path
-sys.path.append(os.path.abspath(os.path.dirname(__file__)))
-
-# Create necessary directories before setting up logging
-os.makedirs("logs", exist_ok=True)
-os.makedirs("data", exist_ok=True)
-
-# Set up root logger before importing other modules
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(f"logs/followers_tracker_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"),
-        logging.StreamHandler()
-    ]
-)
+from typing import Dict, Any, List, Optional, Tuple
+
+import requests
+
+# Directories the application writes to (log files, local stat backups)
+RUNTIME_DIRS = ("logs", "data")
+
+_bootstrapped = False
+
+def _bootstrap() -> None:
+    """Create the runtime directories once per process."""
+    global _bootstrapped
+    if _bootstrapped:
+        return
+    for directory in RUNTIME_DIRS:
+        os.makedirs(directory, exist_ok=True)
+    _bootstrapped = True
+
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+def setup_logging(verbose: bool = False, log_file: Optional[str] = None) -> None:
+    """
+    Configure the root logger with a console handler and a single file handler.
+
+    Does nothing if the root logger already has handlers, so importing this
+    module (e.g. from tests) never opens a log file.
+
+    Args:
+        verbose: Log at DEBUG level instead of INFO
+        log_file: Path to the log file (default: logs/followers_tracker_[timestamp].log)
+    """
+    root_logger = logging.getLogger()
+    if root_logger.handlers:
+        return
+
+    if log_file is None:
+        log_file = f"logs/followers_tracker_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
+
+    logging.basicConfig(
+        level=logging.DEBUG if verbose else logging.INFO,
+        format=LOG_FORMAT,
+        handlers=[
+            logging.FileHandler(log_file),
+            logging.StreamHandler()
+        ]
+    )
 
 logger = logging.getLogger(__name__)
 
@@ -44,14 +75,70 @@ from services.youtube import YouTubeService
 from services.threads import ThreadsProfileService
 from utils.followers_submitter import FollowersSubmitter
 from services.tiktok import TikTok
-from utils.exceptions import (
-    ScrapingError, APIError, RateLimitError, DataSubmissionError
-)
 from config.settings import (
-    AIFC_LKD_PAGE, BI_LKD_PAGE, NBO_LKD_PAGE, EXCEL_CHEATSHEETS_LKD_PAGE, FACEBOOK_URL,
+    AIFC_LKD_PAGE, BI_LKD_PAGE, NBO_LKD_PAGE, EXCEL_CHEATSHEETS_LKD_PAGE,
     INSTAGRAM_USERNAME, INSTAGRAM_USERNAME_AIFC
 )
 
+# LinkedIn company pages, in collection order, and their display names
+LINKEDIN_COMPANY_URLS = (
+    AIFC_LKD_PAGE,
+    BI_LKD_PAGE,
+    NBO_LKD_PAGE,
+    EXCEL_CHEATSHEETS_LKD_PAGE
+)
+LINKEDIN_COMPANY_NAMES = (
+    "AI Finance Club",
+    "Business Infographics",
+    "Nicolas Boucher Online",
+    "Excel Cheatsheets"
+)
+
+NOT_FOUND = "Not Found"
+
+# How many of the collectors that may launch Chromium run at once (each
+# browser costs hundreds of MB). Every such collector keeps at most one
+# browser open at a time, so this is also the cap on concurrent browsers.
+BROWSER_COLLECTOR_SLOTS = 2
+_browser_slots = threading.Semaphore(BROWSER_COLLECTOR_SLOTS)
+
+# Pause between the LinkedIn collectors. They run one after another, and the
+# company pages load on a single browser one at a time, so this process never
+# sends LinkedIn concurrent scrapes
+LINKEDIN_SPACING_SECONDS = 2
+
+def _with_browser_slot(collector):
+    """Wrap a collector so it waits for one of the BROWSER_COLLECTOR_SLOTS."""
+    @functools.wraps(collector)
+    def run(*args, **kwargs):
+        with _browser_slots:
+            return collector(*args, **kwargs)
+    return run
+
+def _fallback(platform: str, error: Optional[Exception] = None,
+              metrics: Tuple[str, ...] = ("followers",),
+              timestamp: Optional[float] = None, **extra: Any) -> Dict[str, Any]:
+    """
+    Build the placeholder result returned when a collector fails.
+
+    Args:
+        platform: Platform name for the "platform" key
+        error: The exception that caused the failure, if any
+        metrics: Metric keys to fill with "Not Found"
+        timestamp: Timestamp to record (default: now)
+        **extra: Additional keys identifying the result (type, name, ...)
+
+    Returns:
+        Dictionary in the same shape as a successful service result
+    """
+    data = {"platform": platform, **extra}
+    for metric in metrics:
+        data[metric] = NOT_FOUND
+    if error is not None:
+        data["error"] = str(error)
+    data["timestamp"] = time.time() if timestamp is None else timestamp
+    return data
+
 def collect_linkedin_profile_data() -> Dict[str, Any]:
     """
     Collect data from LinkedIn personal profile.
@@ -70,13 +157,7 @@ def collect_linkedin_profile_data() -> Dict[str, Any]:
 
     except Exception as e:
         logger.error(f"Failed to collect LinkedIn profile data: {str(e)}")
-        return {
-            "platform": "LinkedIn",
-            "type": "Personal Profile",
-            "followers": "Not Found",
-            "error": str(e),
-            "timestamp": time.time()
-        }
+        return _fallback("LinkedIn", e, type="Personal Profile")
 
 def collect_linkedin_company_data() -> List[Dict[str, Any]]:
     """
@@ -87,15 +168,10 @@ def collect_linkedin_company_data() -> List[Dict[str, Any]]:
     """
     logger.info("Collecting LinkedIn company data...")
 
-    company_urls = [
-        AIFC_LKD_PAGE,
-        BI_LKD_PAGE,
-        NBO_LKD_PAGE,
-        EXCEL_CHEATSHEETS_LKD_PAGE
-    ]
-
     try:
-        service = LinkedInCompanyService(company_urls)
+        # One browser, not the service's default two: the LinkedIn collectors
+        # never scrape concurrently, and the collector holds one browser slot
+        service = LinkedInCompanyService(list(LINKEDIN_COMPANY_URLS), max_browsers=1)
         data = service.get_all_company_data()
 
         for company in data:
@@ -106,21 +182,10 @@ def collect_linkedin_company_data() -> List[Dict[str, Any]]:
     except Exception as e:
         logger.error(f"Failed to collect LinkedIn company data: {str(e)}")
 
+        now = time.time()
         return [
-            {
-                "platform": "LinkedIn",
-                "type": "Company Page",
-                "name": name,
-                "followers": "Not Found",
-                "error": str(e),
-                "timestamp": time.time()
-            }
-            for name in [
-                "AI Finance Club",
-                "Business Infographics",
-                "Nicolas Boucher Online",
-                "Excel Cheatsheets"
-            ]
+            _fallback("LinkedIn", e, timestamp=now, type="Company Page", name=name)
+            for name in LINKEDIN_COMPANY_NAMES
         ]
 
 def collect_linkedin_newsletter_data() -> Dict[str, Any]:
@@ -141,13 +206,27 @@ def collect_linkedin_newsletter_data() -> Dict[str, Any]:
 
     except Exception as e:
         logger.error(f"Failed to collect LinkedIn newsletter data: {str(e)}")
-        return {
-            "platform": "LinkedIn",
-            "type": "Newsletter",
-            "subscribers": "Not Found",
-            "error": str(e),
-            "timestamp": time.time()
-        }
+        return _fallback("LinkedIn", e, metrics=("subscribers",), type="Newsletter")
+
+def collect_linkedin_data() -> Dict[str, Any]:
+    """
+    Collect the LinkedIn profile, company and newsletter data in turn.
+
+    Returns:
+        Dictionary with the "linkedin_profile", "linkedin_company" and
+        "linkedin_newsletter" results
+    """
+    profile_data = collect_linkedin_profile_data()
+    time.sleep(LINKEDIN_SPACING_SECONDS)
+    company_data = collect_linkedin_company_data()
+    time.sleep(LINKEDIN_SPACING_SECONDS)
+    newsletter_data = collect_linkedin_newsletter_data()
+
+    return {
+        "linkedin_profile": profile_data,
+        "linkedin_company": company_data,
+        "linkedin_newsletter": newsletter_data,
+    }
 
 def collect_twitter_data() -> Dict[str, Any]:
     """
@@ -167,12 +246,7 @@ def collect_twitter_data() -> Dict[str, Any]:
 
     except Exception as e:
         logger.error(f"Failed to collect Twitter data: {str(e)}")
-        return {
-            "platform": "Twitter",
-            "followers": "Not Found",
-            "error": str(e),
-            "timestamp": time.time()
-        }
+        return _fallback("Twitter", e)
 
 def collect_instagram_data() -> Dict[str, Dict[str, Any]]:
     """
@@ -184,14 +258,6 @@ def collect_instagram_data() -> Dict[str, Dict[str, Any]]:
     """
     logger.info("Collecting Instagram data (personal + AI Finance Club)...")
 
-    def _fallback(username: str) -> Dict[str, Any]:
-        return {
-            "platform": "Instagram",
-            "username": username,
-            "followers": "Not Found",
-            "timestamp": time.time()
-        }
-
     try:
         service = InstagramService()
         results = service.get_followers_bulk([
@@ -199,13 +265,13 @@ def collect_instagram_data() -> Dict[str, Dict[str, Any]]:
             INSTAGRAM_USERNAME_AIFC
         ])
 
-        personal = results.get(INSTAGRAM_USERNAME) or _fallback(INSTAGRAM_USERNAME)
-        aifc = results.get(INSTAGRAM_USERNAME_AIFC) or _fallback(INSTAGRAM_USERNAME_AIFC)
+        personal = results.get(INSTAGRAM_USERNAME) or _fallback("Instagram", username=INSTAGRAM_USERNAME)
+        aifc = results.get(INSTAGRAM_USERNAME_AIFC) or _fallback("Instagram", username=INSTAGRAM_USERNAME_AIFC)
 
         # Normalize None -> "Not Found" so downstream stays consistent
         for profile in (personal, aifc):
             if profile.get("followers") is None:
-                profile["followers"] = "Not Found"
+                profile["followers"] = NOT_FOUND
 
         logger.info(f"Instagram personal ({INSTAGRAM_USERNAME}): {personal['followers']} followers")
         logger.info(f"Instagram AIFC ({INSTAGRAM_USERNAME_AIFC}): {aifc['followers']} followers")
@@ -214,10 +280,8 @@ def collect_instagram_data() -> Dict[str, Dict[str, Any]]:
 
     except Exception as e:
         logger.error(f"Failed to collect Instagram data: {str(e)}")
-        personal = _fallback(INSTAGRAM_USERNAME)
-        aifc = _fallback(INSTAGRAM_USERNAME_AIFC)
-        personal["error"] = str(e)
-        aifc["error"] = str(e)
+        personal = _fallback("Instagram", e, username=INSTAGRAM_USERNAME)
+        aifc = _fallback("Instagram", e, username=INSTAGRAM_USERNAME_AIFC)
         return {"personal": personal, "aifc": aifc}
 
 def collect_facebook_data() -> Dict[str, Any]:
@@ -243,12 +307,7 @@ def collect_facebook_data() -> Dict[str, Any]:
 
     except Exception as e:
         logger.error(f"Failed to collect Facebook data: {str(e)}")
-        return {
-            "platform": "Facebook",
-            "followers": "Not Found",
-            "error": str(e),
-            "timestamp": time.time()
-        }
+        return _fallback("Facebook", e)
 
 def collect_youtube_data() -> Dict[str, Any]:
     """
@@ -272,13 +331,7 @@ def collect_youtube_data() -> Dict[str, Any]:
 
     except Exception as e:
         logger.error(f"Failed to collect YouTube data: {str(e)}")
-        return {
-            "platform": "YouTube",
-            "subscribers": "Not Found",
-            "views": "Not Found",
-            "error": str(e),
-            "timestamp": time.time()
-        }
+        return _fallback("YouTube", e, metrics=("subscribers", "views"))
 
 def collect_kit_data() -> Dict[str, Dict[str, Any]]:
     """
@@ -299,14 +352,8 @@ def collect_kit_data() -> Dict[str, Dict[str, Any]]:
     except Exception as e:
         logger.error(f"Failed to collect Kit data: {str(e)}")
         return {
-            time_range: {
-                "platform": "Kit",
-                "time_range": time_range,
-                "subscribers": "Not Found",
-                "error": str(e),
-                "timestamp": time.time()
-            }
-            for time_range in ["daily", "weekly", "monthly"]
+            time_range: _fallback("Kit", e, metrics=("subscribers",), time_range=time_range)
+            for time_range in ("daily", "weekly", "monthly")
         }
 
 def collect_tiktok_data():
@@ -332,12 +379,7 @@ def collect_threads_data() -> Dict[str, Any]:
 
     except Exception as e:
         logger.error(f"Failed to collect Threads data: {str(e)}")
-        return {
-            "platform": "Threads",
-            "followers": "Not Found",
-            "error": str(e),
-            "timestamp": time.time()
-        }
+        return _fallback("Threads", e)
 
 def submit_data(
     linkedin_profile_data: Dict[str, Any],
@@ -369,42 +411,40 @@ def submit_data(
         kit_data: Kit data
 
     Returns:
-        True if all submissions were successful, False otherwise
+        True if no submission failed (a form with no data is skipped), False otherwise
     """
     logger.info("Submitting data to Google Forms...")
 
     try:
-        submitter = FollowersSubmitter()
-
-        # Submit followers data
-        followers_success = submitter.submit_followers_data(
-            linkedin_profile_data,
-            linkedin_company_data,
-            linkedin_newsletter_data,
-            youtube_data,
-            instagram_data,
-            instagram_aifc_data,
-            facebook_data,
-            twitter_data,
-            tiktok_data,
-            threads_data,
-            kit_data["daily"]
-        )
-
-        # Submit Kit stats data
-        kit_success = submitter.submit_kit_stats(
-            kit_data["daily"],
-            kit_data["weekly"],
-            kit_data["monthly"]
-        )
-
-        if followers_success and kit_success:
+        # Both forms live on docs.google.com, so one session pools the
+        # connections the two concurrent submissions use.
+        with requests.Session() as session:
+            submitter = FollowersSubmitter(session=session)
+
+            # Submit followers data and Kit stats data
+            followers_success, kit_success = submitter.submit_all(
+                linkedin_profile_data,
+                linkedin_company_data,
+                linkedin_newsletter_data,
+                youtube_data,
+                instagram_data,
+                instagram_aifc_data,
+                facebook_data,
+                twitter_data,
+                tiktok_data,
+                threads_data,
+                kit_data
+            )
+
+        # None means a form was skipped for lack of data, which the
+        # submitter has already logged; only False is a failed submission
+        if followers_success is not False and kit_success is not False:
             logger.info("All data successfully submitted to Google Forms")
             return True
         else:
-            if not followers_success:
+            if followers_success is False:
                 logger.error("Failed to submit followers data")
-            if not kit_success:
+            if kit_success is False:
                 logger.error("Failed to submit Kit stats data")
             return False
 
@@ -422,17 +462,36 @@ def run_followers_tracker():
     start_time = time.time()
 
     try:
-        # Step 1: Collect data from all platforms
-        linkedin_profile_data = collect_linkedin_profile_data()
-        linkedin_company_data = collect_linkedin_company_data()
-        linkedin_newsletter_data = collect_linkedin_newsletter_data()
-        twitter_data = collect_twitter_data()
-        instagram_results = collect_instagram_data()  # both profiles, one call
-        facebook_data = collect_facebook_data()
-        youtube_data = collect_youtube_data()
-        tiktok_data = collect_tiktok_data()
-        threads_data = collect_threads_data()
-        kit_data = collect_kit_data()
+        # Step 1: Collect data from all platforms concurrently. The collectors
+        # are independent and I/O-bound, and each one handles its own errors.
+        # Those that may launch a browser share BROWSER_COLLECTOR_SLOTS; the
+        # rest get a thread each and never wait behind them.
+        collectors = {
+            "linkedin": _with_browser_slot(collect_linkedin_data),
+            "twitter": collect_twitter_data,
+            "instagram": _with_browser_slot(collect_instagram_data),  # both profiles, one call
+            "facebook": _with_browser_slot(collect_facebook_data),
+            "youtube": collect_youtube_data,
+            "tiktok": _with_browser_slot(collect_tiktok_data),
+            "threads": _with_browser_slot(collect_threads_data),
+            "kit": collect_kit_data,
+        }
+
+        with ThreadPoolExecutor(max_workers=len(collectors)) as executor:
+            futures = {name: executor.submit(collector) for name, collector in collectors.items()}
+            results = {name: future.result() for name, future in futures.items()}
+        results.update(results.pop("linkedin"))
+
+        linkedin_profile_data = results["linkedin_profile"]
+        linkedin_company_data = results["linkedin_company"]
+        linkedin_newsletter_data = results["linkedin_newsletter"]
+        twitter_data = results["twitter"]
+        instagram_results = results["instagram"]
+        facebook_data = results["facebook"]
+        youtube_data = results["youtube"]
+        tiktok_data = results["tiktok"]
+        threads_data = results["threads"]
+        kit_data = results["kit"]
 
         # Step 2: Submit data to Google Forms
         submission_success = submit_data(
@@ -465,12 +524,13 @@ def run_followers_tracker():
         logger.error(f"Execution time before failure: {execution_time:.2f} seconds")
         return False
 
-def parse_arguments():
+@functools.lru_cache(maxsize=None)
+def _build_parser() -> argparse.ArgumentParser:
     """
-    Parse command line arguments.
+    Build the command line parser once and reuse it.
 
     Returns:
-        Parsed arguments
+        The argument parser for the application
     """
     parser = argparse.ArgumentParser(description='Followers Tracker')
 
@@ -487,21 +547,32 @@ def parse_arguments():
         help='Path to log file (default: logs/followers_tracker_[timestamp].log)'
     )
 
-    return parser.parse_args()
+    return parser
+
+def parse_arguments(argv: Optional[List[str]] = None):
+    """
+    Parse command line arguments.
+
+    Args:
+        argv: Arguments to parse (default: sys.argv[1:])
+
+    Returns:
+        Parsed arguments
+    """
+    return _build_parser().parse_args(argv)
 
 if __name__ == "__main__":
     args = parse_arguments()
 
+    _bootstrap()
+    setup_logging(verbose=args.verbose, log_file=args.log_file)
+
     if args.verbose:
-        logging.getLogger().setLevel(logging.DEBUG)
         logger.debug("Verbose logging enabled")
 
     if args.log_file:
-        file_handler = logging.FileHandler(args.log_file)
-        file_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
-        logging.getLogger().addHandler(file_handler)
         logger.info(f"Logging to file: {args.log_file}")
 
     success = run_followers_tracker()
 
-    sys.exit(0 if success else 1)
\ No newline at end of file
+    sys.exit(0 if success else 1)
@@ -2,12 +2,8 @@ import re
 import time
 import logging
 from typing import Optional, Dict, Any
-import os, sys
-
 from services.linkedin_profile import LinkedInProfileService
 
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-
 
 from config.settings import FACEBOOK_URL
 from utils.playwright_driver import PlaywrightDriver
@@ -15,6 +11,27 @@ from utils.exceptions import ScrapingError
 
 logger = logging.getLogger(__name__)
 
+# Follower/like-count patterns in order of preference, compiled once at import.
+# Facebook uses different labels, so several are tried.
+FOLLOWERS_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'([\d,\.]+)\s+followers',
+    r'([\d,\.]+)\s+likes',
+    r'([\d,\.]+)\s+people like this',
+    r'"fan_count"[:\s]+([\d]+)',
+    r'"follower_count"[:\s]+([\d]+)',
+    r'"likers_count"[:\s]+([\d]+)',
+))
+
+# Strips thousands separators from a matched count in one pass.
+SEPARATORS_TABLE = str.maketrans('', '', ',.')
+
+# Longest we wait after navigation for a follower/like count to render.
+PAGE_SETTLE_MS = 5000
+
+# True once the DOM holds something the extraction patterns below can match.
+COUNT_RENDERED_JS = r"""() => /[\d,.]+\s+(followers|likes|people like this)|"(fan_count|follower_count|likers_count)"[:\s]+\d/i
+    .test(document.documentElement.innerHTML)"""
+
 class FacebookProfileService:
     def __init__(self, profile_url: str = FACEBOOK_URL, max_retries: int = 5, retry_wait_seconds: int = 10):
         """
@@ -30,57 +47,78 @@ class FacebookProfileService:
         self.retry_wait_seconds = retry_wait_seconds
         logger.info(f"Facebook Profile Service initialized for URL: {profile_url}")
 
-    def get_followers(self) -> Optional[int]:
+    def get_followers(self, driver: Optional[PlaywrightDriver] = None) -> Optional[int]:
+        """
+        Get the number of followers for the Facebook profile.
+        
+        Args:
+            driver: Optional driver whose browser to reuse. Each attempt still
+                    loads the page in a fresh context, which is closed
+                    afterwards; the browser is left running for the caller to
+                    close. If None, a browser is launched for this call alone.
         
+        Returns:
+            The follower (or like) count as an integer, or None if not found.
+            
+        Raises:
+            ScrapingError: If there is an error during the scraping process.
+        """
+        from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+        
+        owns_driver = driver is None
+        if owns_driver:
+            driver = PlaywrightDriver()
         retries = 0
 
-        while retries <= self.max_retries:
-            # Create a fresh driver instance for each attempt
-            driver = PlaywrightDriver()
-            context = None
-            
-            try:
-                # Initialize browser
-                context = driver.initialize_driver()
-                page = context.new_page()
-                
-                logger.info(f"Navigating to Facebook profile URL: {self.profile_url}")
-                page.goto(self.profile_url, timeout=60000)
-                time.sleep(5)  # Wait for the page to load completely
+        try:
+            while retries <= self.max_retries:
+                context = None
                 
-                content = page.content()
+                try:
+                    # The browser is launched once; each attempt gets a fresh
+                    # context. Only the HTML is read, so skip images, fonts and the like
+                    context = driver.new_context(block_resources=True)
+                    page = context.new_page()
+                    
+                    logger.info(f"Navigating to Facebook profile URL: {self.profile_url}")
+                    page.goto(self.profile_url, timeout=60000)
+                    # Wait for the count to render, capped at the old fixed 5s sleep
+                    try:
+                        page.wait_for_function(COUNT_RENDERED_JS, timeout=PAGE_SETTLE_MS, polling=250)
+                    except PlaywrightTimeoutError:
+                        logger.debug("No follower count rendered yet, reading the page as is")
+                    
+                    content = page.content()
+                    
+                    for pattern in FOLLOWERS_PATTERNS:
+                        match = pattern.search(content)
+                        if match:
+                            try:
+                                followers_count = int(match.group(1).translate(SEPARATORS_TABLE))
+                            except ValueError:
+                                # Separators only (e.g. "page. followers"); try the next label
+                                continue
+                            logger.info(f"Found count via pattern '{pattern.pattern}': {followers_count}")
+                            return followers_count
+                    
+                    else:
+                        logger.warning("Followers count not found on the page.")
+                        retries += 1
+                        time.sleep(self.retry_wait_seconds)
                 
-                # Regex pattern to find follower count
-                # Try multiple patterns since Facebook uses different labels
-                patterns = [
-                    r'([\d,\.]+)\s+followers',
-                    r'([\d,\.]+)\s+likes',
-                    r'([\d,\.]+)\s+people like this',
-                    r'"fan_count"[:\s]+([\d]+)',
-                    r'"follower_count"[:\s]+([\d]+)',
-                    r'"likers_count"[:\s]+([\d]+)',
-                ]
-
-                for pattern in patterns:
-                    match = re.search(pattern, content, re.IGNORECASE)
-                    if match:
-                        followers_str = match.group(1).replace(',', '').replace('.', '')
-                        followers_count = int(followers_str)
-                        logger.info(f"Found count via pattern '{pattern}': {followers_count}")
-                        return followers_count
+                except Exception as e:
+                    logger.error(f"Error while scraping Facebook profile: {e}")
+                    raise ScrapingError(f"Error while scraping Facebook profile: {e}")
                 
-                else:
-                    logger.warning("Followers count not found on the page.")
-                    retries += 1
-                    time.sleep(self.retry_wait_seconds)
-            
-            except Exception as e:
-                logger.error(f"Error while scraping Facebook profile: {e}")
-                raise ScrapingError(f"Error while scraping Facebook profile: {e}")
-            
-            finally:
-                if context:
-                    driver.close(context=context)
+                finally:
+                    if context:
+                        context.close()
+        
+        finally:
+            if owns_driver:
+                driver.close_resources()
+        
+        return None
         
 
 if __name__ == "__main__":
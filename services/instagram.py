@@ -17,20 +17,15 @@ we warm the context up with a throwaway homepage hit and retry each profile a
 couple of times to ride through that.
 """
 
-import os, sys
-
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-
-import json
+import re
 import time
 import logging
+from collections import deque
 from pathlib import Path
+from types import MappingProxyType
 from typing import Dict, Any, List, Optional
-from urllib.parse import urlsplit
 
-from bs4 import BeautifulSoup
-from playwright.sync_api import sync_playwright
-from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+import requests
 
 from config.settings import (
     INSTAGRAM_USERNAME,
@@ -38,6 +33,8 @@ from config.settings import (
     SOCIALBLADE_HEADLESS,
     SOCIALBLADE_TIMEOUT_MS,
 )
+from utils.json_utils import json_loads
+from utils.playwright_driver import load_cached_cookies
 
 logger = logging.getLogger(__name__)
 
@@ -49,12 +46,30 @@ PROFILE_ATTEMPTS = 3
 # Seconds to wait after a blocked attempt before retrying (Cloudflare clearance
 # usually lands within a second or two of the challenge being solved).
 RETRY_WAIT_SECONDS = 4
+# Upper bound on how long the warm-up waits for a challenge page to redirect.
+WARM_UP_SETTLE_MS = 3000
 
 UA = (
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
     "(KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36"
 )
 
+# Instagram's own web profile endpoint. When it answers, the count comes back
+# from one plain GET and no browser is launched at all.
+WEB_PROFILE_URL = "https://i.instagram.com/api/v1/users/web_profile_info/"
+WEB_PROFILE_HEADERS = MappingProxyType({
+    "x-ig-app-id": "936619743392459",
+    "User-Agent": "Instagram 219.0.0.12.117 Android",
+})
+WEB_PROFILE_TIMEOUT = 15
+
+# Browser launch flags and context options; constant across calls.
+LAUNCH_ARGS = ("--no-sandbox", "--disable-setuid-sandbox", "--disable-dev-shm-usage")
+CONTEXT_OPTIONS = MappingProxyType({
+    "user_agent": UA,
+    "viewport": {"width": 1366, "height": 900},
+})
+
 # Ad/analytics hosts that never stop making requests.
 BLOCKED_HOSTS = (
     "doubleclick.net",
@@ -75,6 +90,31 @@ BLOCKED_HOSTS = (
     "scorecardresearch.com",
 )
 
+# All of BLOCKED_HOSTS fused into one pattern over the URL's host part, so
+# Playwright matches them itself and only blocked requests reach Python.
+BLOCKED_URL_RE = re.compile(
+    r"^[a-z][a-z0-9+.-]*://[^/?#]*(?:"
+    + "|".join(re.escape(h) for h in BLOCKED_HOSTS)
+    + r")",
+    re.IGNORECASE,
+)
+
+# The Next.js payload script. Next.js escapes "<" inside it, so the first
+# closing tag after the opening one always ends the JSON.
+NEXT_DATA_RE = re.compile(
+    r'<script[^>]*\bid=["\']__NEXT_DATA__["\'][^>]*>(.*?)</script>',
+    re.DOTALL,
+)
+
+# True once the payload script is in the DOM and its text is complete JSON.
+# The element exists as soon as the parser reaches its opening tag, while
+# its text may still be streaming in.
+NEXT_DATA_READY_JS = """() => {
+    const script = document.getElementById("__NEXT_DATA__");
+    if (!script || !script.textContent.trim()) return false;
+    try { JSON.parse(script.textContent); return true; } catch (e) { return false; }
+}"""
+
 SAME_SITE_MAP = {
     "no_restriction": "None",
     "unspecified": "Lax",
@@ -82,26 +122,33 @@ SAME_SITE_MAP = {
     "strict": "Strict",
 }
 
-
 class InstagramService:
     """
     Service for retrieving Instagram follower counts from Socialblade.
 
+    Instagram's web profile endpoint is tried first (one GET, no browser);
+    Socialblade is only loaded for the handles it could not answer.
+
     Can be used for a single username (get_followers) or several usernames
     in one browser session (get_followers_bulk), which is cheaper than
     launching a fresh browser per profile.
     """
 
-    def __init__(self, username: Optional[str] = None, cookies_file: Optional[str] = None):
+    def __init__(self, username: Optional[str] = None, cookies_file: Optional[str] = None,
+                 use_web_api: bool = True):
         """
         Args:
             username: Default Instagram username. Optional if you only
                       use get_followers_bulk() with explicit usernames.
             cookies_file: Path to the Socialblade cookie jar. Defaults to
                           the path from settings.
+            use_web_api: Try Instagram's web profile endpoint first and only
+                         open a Socialblade browser session for the handles
+                         it could not answer.
         """
         self.username = username or INSTAGRAM_USERNAME
         self.cookies_file = Path(cookies_file or SOCIALBLADE_COOKIES_FILE)
+        self.use_web_api = use_web_api
         logger.info(f"Instagram Service initialized (source: socialblade, cookies: {self.cookies_file})")
 
     # ------------------------------------------------------------------ #
@@ -138,36 +185,46 @@ class InstagramService:
         """
         results: Dict[str, Dict[str, Any]] = {}
 
+        # Results are keyed by username, so a repeated handle would only be
+        # fetched (and paused after) again to overwrite its own entry.
+        usernames = list(dict.fromkeys(usernames))
+
+        if self.use_web_api and usernames:
+            results.update(self._fetch_web_profiles(usernames))
+            usernames = [u for u in usernames if u not in results]
+
+        if not usernames:
+            return results
+
         if not self.cookies_file.exists():
             logger.error(
                 f"Socialblade cookie file not found at {self.cookies_file}. "
                 "Cannot fetch Instagram follower counts."
             )
-            return {u: self._result(u, None) for u in usernames}
+            results.update({u: self._result(u, None) for u in usernames})
+            return results
 
         try:
-            cookies = self._load_cookies(self.cookies_file)
+            cookies = load_cached_cookies(self.cookies_file, self._parse_cookies)
         except Exception as e:
             logger.error(f"Failed to parse Socialblade cookies: {e}")
-            return {u: self._result(u, None) for u in usernames}
+            results.update({u: self._result(u, None) for u in usernames})
+            return results
+
+        # Imported here so that importing this module stays cheap; Playwright
+        # is only needed once there is something to fetch.
+        from playwright.sync_api import sync_playwright
+        from utils.playwright_driver import abort_heavy_resources
 
         try:
             with sync_playwright() as p:
-                browser = p.chromium.launch(
-                    headless=SOCIALBLADE_HEADLESS,
-                    args=["--no-sandbox", "--disable-setuid-sandbox", "--disable-dev-shm-usage"],
-                )
-                context = browser.new_context(
-                    user_agent=UA,
-                    viewport={"width": 1366, "height": 900},
-                )
+                browser = p.chromium.launch(headless=SOCIALBLADE_HEADLESS, args=LAUNCH_ARGS)
+                context = browser.new_context(**CONTEXT_OPTIONS)
                 context.add_cookies(cookies)
-                context.route(
-                    "**/*",
-                    lambda route: route.abort()
-                    if any(h in urlsplit(route.request.url).netloc for h in BLOCKED_HOSTS)
-                    else route.continue_(),
-                )
+                # Routes registered later are matched first, so ad hosts are
+                # aborted before the resource-type filter is consulted.
+                context.route("**/*", abort_heavy_resources)
+                context.route(BLOCKED_URL_RE, lambda route: route.abort())
 
                 # Warm the context up so the Cloudflare challenge is cleared
                 # BEFORE the first real profile fetch (otherwise the first
@@ -194,6 +251,47 @@ class InstagramService:
     # Internals
     # ------------------------------------------------------------------ #
 
+    def _fetch_web_profiles(self, usernames: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Read follower counts from Instagram's web profile endpoint.
+
+        Returns results only for the handles it could answer; the rest are
+        left for the Socialblade browser session. The endpoint rate-limits
+        unauthenticated callers hard, so a 429 ends the loop rather than
+        spending the remaining handles on it.
+        """
+        results: Dict[str, Dict[str, Any]] = {}
+
+        with requests.Session() as session:
+            for username in usernames:
+                try:
+                    response = session.get(
+                        WEB_PROFILE_URL,
+                        params={"username": username},
+                        headers=WEB_PROFILE_HEADERS,
+                        timeout=WEB_PROFILE_TIMEOUT,
+                    )
+                    if response.status_code == 429:
+                        logger.info("Instagram web profile endpoint rate-limited; using Socialblade")
+                        break
+                    if response.status_code != 200:
+                        logger.info(
+                            f"[{username}] Instagram web profile endpoint returned HTTP "
+                            f"{response.status_code}; using Socialblade"
+                        )
+                        continue
+
+                    data = json_loads(response.content)
+                    followers = int(data["data"]["user"]["edge_followed_by"]["count"])
+                except Exception as e:
+                    logger.info(f"[{username}] Instagram web profile lookup failed ({e}); using Socialblade")
+                    continue
+
+                logger.info(f"[{username}] Follower count: {followers} (web profile endpoint)")
+                results[username] = self._result(username, followers, source="instagram_web_profile")
+
+        return results
+
     def _warm_up(self, context) -> None:
         """
         Prime the context against Cloudflare by hitting the homepage once.
@@ -204,13 +302,24 @@ class InstagramService:
         throwaway homepage hit means the profile fetches that follow start
         already cleared. Best-effort: failures here are non-fatal.
         """
+        from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
         page = context.new_page()
         try:
             resp = page.goto(HOME_URL, wait_until="domcontentloaded", timeout=SOCIALBLADE_TIMEOUT_MS)
             status = resp.status if resp else "unknown"
             logger.info(f"Socialblade warm-up hit homepage (HTTP {status})")
-            # Give any challenge redirect a moment to settle and set clearance.
-            time.sleep(3)
+            if status != 200:
+                # Challenge page: wait for it to redirect (which is when the
+                # clearance cookie lands), but no longer than WARM_UP_SETTLE_MS.
+                try:
+                    page.wait_for_event(
+                        "framenavigated",
+                        predicate=lambda frame: frame == page.main_frame,
+                        timeout=WARM_UP_SETTLE_MS,
+                    )
+                except PlaywrightTimeoutError:
+                    logger.info("Socialblade warm-up saw no challenge redirect (continuing)")
         except Exception as e:
             logger.warning(f"Socialblade warm-up navigation failed (continuing anyway): {e}")
         finally:
@@ -256,8 +365,10 @@ class InstagramService:
                     )
                     return self._result(username, None)
 
-                # Comes back as int on some routes, str on others.
-                followers = int(followers)
+                # Comes back as int on some routes, str (possibly with
+                # thousands separators) on others.
+                if not isinstance(followers, int):
+                    followers = int(str(followers).replace(",", ""))
                 logger.info(f"[{username}] Follower count: {followers}")
                 return self._result(username, followers)
 
@@ -289,21 +400,32 @@ class InstagramService:
         This avoids reading response.body() inside an event handler, which
         races page teardown and throws TargetClosedError.
         """
+        from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
         target = URL_TEMPLATE.format(handle=handle)
         page = context.new_page()
 
         try:
             # NOT networkidle -- ad tags keep the connection count above zero
             # forever, so that condition can never be satisfied on this site.
-            response = page.goto(target, wait_until="domcontentloaded", timeout=SOCIALBLADE_TIMEOUT_MS)
+            # We don't even wait for domcontentloaded: the payload script is
+            # all we read, so stop as soon as its JSON is complete rather than
+            # after the deferred Next.js bundles have run.
+            response = page.goto(target, wait_until="commit", timeout=SOCIALBLADE_TIMEOUT_MS)
             status = response.status if response else None
+            if status is None or status == 200:
+                try:
+                    page.wait_for_function(NEXT_DATA_READY_JS, timeout=SOCIALBLADE_TIMEOUT_MS)
+                except PlaywrightTimeoutError:
+                    # Let the caller report the missing payload as usual.
+                    pass
             html = page.content()
             return html, status
         finally:
             page.close()
 
     @staticmethod
-    def _load_cookies(path: Path) -> List[Dict[str, Any]]:
+    def _parse_cookies(path: Path) -> List[Dict[str, Any]]:
         """
         Translate a Chrome-extension cookie export into Playwright's schema.
 
@@ -313,7 +435,7 @@ class InstagramService:
           - hostOnly is expressed via the leading dot on domain
           - hostOnly/session/storeId have no equivalent and are rejected outright
         """
-        raw = json.loads(path.read_text(encoding="utf-8"))
+        raw = json_loads(path.read_bytes())
         cookies = []
 
         for c in raw:
@@ -345,47 +467,54 @@ class InstagramService:
 
     @staticmethod
     def _extract_next_data(html: str) -> Dict[str, Any]:
-        soup = BeautifulSoup(html, "html.parser")
-        tag = soup.find("script", id="__NEXT_DATA__")
-        if tag is None or not tag.string:
+        """
+        Slice the __NEXT_DATA__ JSON straight out of the markup and parse it.
+
+        Only one script tag is needed, so this skips building a DOM for the
+        whole page.
+        """
+        match = NEXT_DATA_RE.search(html)
+        if match is None or not match.group(1).strip():
             raise RuntimeError("No __NEXT_DATA__ tag -- blocked, or the page changed.")
-        return json.loads(tag.string)
+        return json_loads(match.group(1))
 
-    @classmethod
-    def _find_platform_result(cls, node):
+    @staticmethod
+    def _find_platform_result(node):
         """
         DFS for the first dict holding a 'platformResult' key.
 
         The tRPC queries array isn't stably ordered, so indexing into it by position
-        is brittle. Walking the tree costs nothing at this payload size.
+        is brittle. Walking the tree costs nothing at this payload size. The walk
+        uses an explicit stack (children pushed in reverse, so the visiting order
+        matches a recursive DFS) rather than a Python frame per level.
         """
-        if isinstance(node, dict):
-            if isinstance(node.get("platformResult"), dict):
-                return node["platformResult"]
-            for value in node.values():
-                found = cls._find_platform_result(value)
-                if found is not None:
-                    return found
-        elif isinstance(node, list):
-            for item in node:
-                found = cls._find_platform_result(item)
-                if found is not None:
+        stack = deque([node])
+        while stack:
+            current = stack.pop()
+            if isinstance(current, dict):
+                found = current.get("platformResult")
+                if isinstance(found, dict):
                     return found
+                stack.extend(reversed(list(current.values())))
+            elif isinstance(current, list):
+                stack.extend(reversed(current))
         return None
 
     @staticmethod
-    def _result(username: str, followers: Optional[int]) -> Dict[str, Any]:
+    def _result(username: str, followers: Optional[int],
+                source: str = "socialblade_live") -> Dict[str, Any]:
         """Build the result dict the rest of the pipeline expects."""
         return {
             "platform": "Instagram",
             "username": username,
             "followers": followers,
             "timestamp": time.time(),
-            "source": "socialblade_live",
+            "source": source,
         }
 
 
 if __name__ == "__main__":
+    # Run from the project root: python -m services.instagram
     logging.basicConfig(level=logging.INFO)
     service = InstagramService()
     result = service.get_followers_bulk(["nicolasboucherfinance", "theaifinanceclub"])
@@ -7,15 +7,57 @@ from the Kit (formerly ConvertKit) API.
 
 import time
 import logging
+import functools
 import requests
-from datetime import datetime, timedelta
-from typing import Dict, Any, Optional, List
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from typing import Dict, Any, Optional, List, Tuple
 
 from config.settings import KIT_API_KEY, KIT_GROWTH_STATS_ENDPOINT
 from utils.exceptions import APIError, RateLimitError
+from utils.json_utils import json_loads
 
 logger = logging.getLogger(__name__)
 
+
+@functools.lru_cache(maxsize=32)
+def _date_range(time_range: str, today_ordinal: int) -> Tuple[str, str]:
+    """
+    Build the formatted (starting, ending) dates for a time range.
+    
+    Cached per (time range, day), so repeated pulls on the same day reuse the
+    strings instead of redoing the date arithmetic and strftime calls.
+    
+    Args:
+        time_range: "daily", "weekly" or "monthly"
+        today_ordinal: Proleptic Gregorian ordinal of the current (CET) day
+        
+    Returns:
+        Tuple of the starting and ending dates in the format the Kit API expects
+        
+    Raises:
+        ValueError: If the time range is not one of the supported values
+    """
+    today = date.fromordinal(today_ordinal)
+    
+    if time_range == "daily":
+        start_date = today - timedelta(days=1)
+        end_date = start_date
+    elif time_range == "weekly":
+        start_date = today - timedelta(days=7)
+        end_date = today - timedelta(days=1)
+    elif time_range == "monthly":
+        start_date = today - timedelta(days=30)
+        end_date = today - timedelta(days=1)
+    else:
+        error_msg = f"Invalid time range: {time_range}. Must be 'daily', 'weekly', or 'monthly'"
+        logger.error(error_msg)
+        raise ValueError(error_msg)
+    
+    return (start_date.strftime("%Y-%m-%dT00:00:00+01:00"),
+            end_date.strftime("%Y-%m-%dT23:59:59+01:00"))
+
+
 class KitService:
     """
     Service for retrieving data from the Kit API.
@@ -24,15 +66,34 @@ class KitService:
     and monthly data from the Kit API.
     """
     
-    def __init__(self, api_key: Optional[str] = None):
+    # How long a successful pull is reused for, per time range (seconds).
+    # The stats only move on day boundaries, so repeated polls within these
+    # windows are answered from memory.
+    CACHE_TTL_SECONDS = {
+        "daily": 3600,
+        "weekly": 21600,
+        "monthly": 86400
+    }
+    
+    def __init__(self, api_key: Optional[str] = None, session: Optional[requests.Session] = None):
         """
         Initialize the Kit Service.
         
         Args:
             api_key: Kit API key for authentication. If None, uses the key from settings.
+            session: Optional session to send requests through. If None, the
+                     service creates its own, so repeated pulls (and the three
+                     ranges in get_all_stats) reuse one keep-alive connection.
         """
         self.api_key = api_key or KIT_API_KEY
         self.endpoint = KIT_GROWTH_STATS_ENDPOINT
+        self.session = session or requests.Session()
+        self.headers = {
+            'Accept': 'application/json',
+            'X-Kit-Api-Key': self.api_key
+        }
+        # (time_range, starting, ending) -> (monotonic fetch time, result)
+        self._cache: Dict[Tuple[str, str, str], Tuple[float, Dict[str, Any]]] = {}
         
         if not self.api_key:
             logger.warning("No Kit API key provided. API calls will likely fail.")
@@ -88,41 +149,27 @@ class KitService:
         Raises:
             APIError: If there is an error with the API request
         """
+        cache_key = None
         try:
-            headers = {
-                'Accept': 'application/json',
-                'X-Kit-Api-Key': self.api_key
-            }
-            
             today = datetime.now() + timedelta(hours=1)  # CET adjustment
-            
-            if time_range == "daily":
-                start_date = today - timedelta(days=1)
-                end_date = start_date
-            elif time_range == "weekly":
-                start_date = today - timedelta(days=7)
-                end_date = today - timedelta(days=1)
-            elif time_range == "monthly":
-                start_date = today - timedelta(days=30)
-                end_date = today - timedelta(days=1)
-            else:
-                error_msg = f"Invalid time range: {time_range}. Must be 'daily', 'weekly', or 'monthly'"
-                logger.error(error_msg)
-                raise ValueError(error_msg)
-            
-            starting_date = start_date.strftime("%Y-%m-%dT00:00:00+01:00")
-            ending_date = end_date.strftime("%Y-%m-%dT23:59:59+01:00")
+            starting_date, ending_date = _date_range(time_range, today.toordinal())
             
             params = {
                 "starting": starting_date,
                 "ending": ending_date
             }
             
+            cache_key = (time_range, starting_date, ending_date)
+            cached = self._cache.get(cache_key)
+            if cached and time.monotonic() - cached[0] < self.CACHE_TTL_SECONDS[time_range]:
+                logger.info(f"Using cached Kit {time_range} stats from {starting_date} to {ending_date}")
+                return dict(cached[1])
+            
             logger.info(f"Fetching Kit {time_range} stats from {starting_date} to {ending_date}")
             
-            response = requests.get(
+            response = self.session.get(
                 self.endpoint,
-                headers=headers,
+                headers=self.headers,
                 params=params,
                 timeout=30
             )
@@ -137,8 +184,8 @@ class KitService:
                 logger.error(error_msg)
                 raise APIError(error_msg, status_code=response.status_code, response=response.text)
             
-            data = response.json()
-            logger.debug(f"{time_range.capitalize()} data: {data}")
+            data = json_loads(response.content)
+            logger.debug("%s data: %s", time_range.capitalize(), data)
             
             # Extract the statistics from the response
             stats = data.get("stats", {})
@@ -154,7 +201,8 @@ class KitService:
             }
             
             logger.info(f"Successfully fetched Kit {time_range} stats: {result['subscribers']} subscribers")
-            return result
+            self._cache[cache_key] = (time.monotonic(), result)
+            return dict(result)
             
         except (APIError, RateLimitError):
             # Re-raise these specific errors
@@ -164,49 +212,63 @@ class KitService:
             error_msg = f"Network error when fetching Kit data: {str(e)}"
             logger.error(error_msg)
             
-            return {
-                "platform": "Kit",
-                "time_range": time_range,
-                "subscribers": "Not Found",
-                "cancellations": "Not Found",
-                "net_new_subscribers": "Not Found",
-                "new_subscribers": "Not Found",
-                "timestamp": time.time(),
-                "error": error_msg
-            }
+            # An expired entry for the same date range is still the right
+            # data, just older; prefer it over a "Not Found" row.
+            stale = self._cache.get(cache_key) if cache_key is not None else None
+            if stale:
+                logger.warning(f"Falling back to cached Kit {time_range} stats")
+                return dict(stale[1], source="stale-cache")
+            
+            return self._not_found(time_range, error_msg)
             
         except Exception as e:
             error_msg = f"Unexpected error fetching Kit data: {str(e)}"
             logger.error(error_msg)
             
-            return {
-                "platform": "Kit",
-                "time_range": time_range,
-                "subscribers": "Not Found",
-                "cancellations": "Not Found",
-                "net_new_subscribers": "Not Found",
-                "new_subscribers": "Not Found",
-                "timestamp": time.time(),
-                "error": error_msg
-            }
+            return self._not_found(time_range, error_msg)
+    
+    @staticmethod
+    def _not_found(time_range: str, error_msg: str) -> Dict[str, Any]:
+        """
+        Build the placeholder statistics returned when a pull fails.
+        
+        Args:
+            time_range: Time range that was requested
+            error_msg: Description of the failure
+            
+        Returns:
+            Dictionary with every statistic set to "Not Found"
+        """
+        return {
+            "platform": "Kit",
+            "time_range": time_range,
+            "subscribers": "Not Found",
+            "cancellations": "Not Found",
+            "net_new_subscribers": "Not Found",
+            "new_subscribers": "Not Found",
+            "timestamp": time.time(),
+            "error": error_msg
+        }
     
     def get_all_stats(self) -> Dict[str, Dict[str, Any]]:
         """
         Get all subscriber statistics (daily, weekly, monthly).
         
+        The three time ranges are independent requests, so they are fetched
+        concurrently.
+        
         Returns:
             Dictionary containing all subscriber statistics
         """
+        time_ranges = ("daily", "weekly", "monthly")
+        
         try:
-            daily_stats = self.get_daily_subscribers()
-            weekly_stats = self.get_weekly_subscribers()
-            monthly_stats = self.get_monthly_subscribers()
-            
-            return {
-                "daily": daily_stats,
-                "weekly": weekly_stats,
-                "monthly": monthly_stats
-            }
+            with ThreadPoolExecutor(max_workers=len(time_ranges)) as executor:
+                futures = {
+                    time_range: executor.submit(self._pull_stats, time_range=time_range)
+                    for time_range in time_ranges
+                }
+                return {time_range: future.result() for time_range, future in futures.items()}
             
         except Exception as e:
             logger.error(f"Error fetching all Kit stats: {str(e)}")
@@ -8,9 +8,9 @@ It extracts data from the HTML response by looking for the followers count patte
 import re
 import time
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
 from typing import Dict, List, Optional, Any, Tuple
-import os, sys
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from config.settings import (
     AIFC_LKD_PAGE,
@@ -18,52 +18,85 @@ from config.settings import (
     NBO_LKD_PAGE,
     EXCEL_CHEATSHEETS_LKD_PAGE
 )
-from utils.playwright_driver import PlaywrightDriver
+from utils.playwright_driver import PlaywrightDriver, BEST_MATCH_IN_PAGE_JS, wait_for_pattern
 from utils.exceptions import ScrapingError
+from utils.scraping import fetch_html
 
 logger = logging.getLogger(__name__)
 
+# Company page URL -> readable company name (read-only, shared by all instances)
+COMPANY_NAMES = MappingProxyType({
+    AIFC_LKD_PAGE: "AI Finance Club",
+    BI_LKD_PAGE: "Business Infographics",
+    NBO_LKD_PAGE: "Nicolas Boucher Online",
+    EXCEL_CHEATSHEETS_LKD_PAGE: "Excel Cheatsheets"
+})
+
+# All follower-count patterns fused into one alternation, so the page is
+# scanned once. Alternatives are listed in order of preference:
+#   text    - "631 followers" or "1,234 followers"
+#   json    - followerCount JSON value (raw or HTML-escaped quote)
+#   general - "N follower" with optional whitespace
+# Digits are spelled [0-9] rather than compiling with re.ASCII, which would
+# also narrow \s and drop the non-breaking and thin spaces LinkedIn's number
+# formatting puts before the word (JavaScript's \s matches them as well).
+FOLLOWERS_RE = re.compile(
+    r'(?P<text>[0-9]+,?[0-9]*)\s+followers'
+    r'|followerCount(?:&quot;|"):(?P<json>[0-9]+)'
+    r'|(?P<general>[0-9]+,?[0-9]*)\s*follower'
+)
+FOLLOWERS_GROUPS = ('text', 'json', 'general')
+
+# The same pick as _extract_followers, run inside the page (see
+# BEST_MATCH_IN_PAGE_JS). JavaScript spells named groups (?<name>...).
+FOLLOWERS_JS_SOURCE = FOLLOWERS_RE.pattern.replace('(?P<', '(?<')
+
+# Pause between two pages loaded by the same browser, so each worker keeps
+# its own requests spaced out to avoid rate limiting
+PAGE_SPACING_SECONDS = 2
+
 class LinkedInCompanyService:
     """
     Service for retrieving data from LinkedIn company pages.
     
     This service extracts follower counts by analyzing the HTML content
-    of LinkedIn company pages. It processes each company page with a fresh
-    browser instance to avoid hitting login screens.
+    of LinkedIn company pages. It processes each company page in a fresh
+    browser context to avoid hitting login screens.
     """
     
-    def __init__(self, company_urls: Optional[List[str]] = None):
+    def __init__(self, company_urls: Optional[List[str]] = None, max_browsers: int = 2):
         """
         Initialize the LinkedIn Company Service.
         
         Args:
             company_urls: List of LinkedIn company page URLs to scrape.
                           If None, uses the default list from settings.
+            max_browsers: Most browsers get_all_company_data runs at once. Each
+                          browser works through its share of the pages in turn,
+                          opening a fresh context per page and spacing them
+                          PAGE_SPACING_SECONDS apart. Pass 1 where LinkedIn
+                          must never see concurrent scrapes from this IP.
         """
+        self.max_browsers = max(1, max_browsers)
         # Use provided URLs or default to the ones from settings
-        self.company_urls = company_urls or [
-            AIFC_LKD_PAGE,
-            BI_LKD_PAGE,
-            NBO_LKD_PAGE,
-            EXCEL_CHEATSHEETS_LKD_PAGE
-        ]
+        self.company_urls = company_urls or list(COMPANY_NAMES)
         
         # Map URLs to company names for more readable output
-        self.url_to_name_map = {
-            AIFC_LKD_PAGE: "AI Finance Club",
-            BI_LKD_PAGE: "Business Infographics",
-            NBO_LKD_PAGE: "Nicolas Boucher Online",
-            EXCEL_CHEATSHEETS_LKD_PAGE: "Excel Cheatsheets"
-        }
+        self.url_to_name_map = COMPANY_NAMES
         
         logger.info(f"LinkedIn Company Service initialized with {len(self.company_urls)} company pages")
     
-    def get_company_followers(self, company_url: str) -> Optional[int]:
+    def get_company_followers(self, company_url: str,
+                              driver: Optional[PlaywrightDriver] = None) -> Optional[int]:
         """
         Get the number of followers for a specific LinkedIn company page.
         
         Args:
             company_url: URL of the LinkedIn company page
+            driver: Optional driver whose browser to reuse. The page is still
+                    loaded in a fresh context, which is closed afterwards; the
+                    browser is left running for the caller to close. If None,
+                    a browser is launched for this page alone.
             
         Returns:
             The number of followers as an integer, or None if not found
@@ -71,30 +104,48 @@ class LinkedInCompanyService:
         Raises:
             ScrapingError: If there is an error during the scraping process
         """
-        # Create a new browser instance for each company page
-        driver = PlaywrightDriver()
+        company_name = self.url_to_name_map.get(company_url, company_url)
+        
+        # A plain GET is enough when LinkedIn serves the public HTML; the
+        # browser (and its context) is only used when it doesn't. Reading
+        # stops at the first match of the top-ranked pattern, which can't be beaten.
+        page_content = fetch_html(company_url, FOLLOWERS_RE, FOLLOWERS_GROUPS[0])
+        if page_content is not None:
+            followers = self._extract_followers(page_content)
+            if followers is not None:
+                logger.info(f"Successfully extracted follower count for {company_name} over HTTP: {followers}")
+                return followers
+            logger.info(f"No follower count in the HTTP response for {company_name}; falling back to the browser")
+        
+        owns_driver = driver is None
+        if owns_driver:
+            driver = PlaywrightDriver()
+        context = None
         
         try:
             # Initialize browser
-            company_name = self.url_to_name_map.get(company_url, company_url)
             logger.info(f"Processing company page: {company_name} ({company_url})")
             
-            context = driver.initialize_driver()
+            # Only the HTML is read, so skip images, fonts and the like
+            if owns_driver:
+                context = driver.initialize_driver(block_resources=True)
+            else:
+                context = driver.new_context(block_resources=True)
             page = context.new_page()
             
             # Navigate to company page
+            # The count is in the initial HTML, so stop at DOMContentLoaded rather
+            # than waiting for every image and tracker to finish loading
             logger.debug(f"Navigating to {company_url}")
-            page.goto(company_url, timeout=120000)  # 2 minutes timeout
+            page.goto(company_url, wait_until="domcontentloaded", timeout=30000)
             
-            # Wait for page to load
+            # Wait for the count to render, capped at the old fixed 3s sleep
             logger.debug("Waiting for page content to load")
-            time.sleep(3)  # Give JavaScript time to load
-            
-            # Extract page content
-            page_content = page.content()
+            if not wait_for_pattern(page, FOLLOWERS_JS_SOURCE):
+                logger.debug("No follower count rendered yet, reading the page as is")
             
             # Extract followers count
-            followers = self._extract_followers(page_content)
+            followers = self._extract_followers_in_page(page)
             
             if followers is not None:
                 logger.info(f"Successfully extracted follower count for {company_name}: {followers}")
@@ -110,8 +161,12 @@ class LinkedInCompanyService:
         
         finally:
             # Clean up resources
-            if 'context' in locals():
-                driver.close(context)
+            if owns_driver:
+                if context:
+                    driver.close(context)
+                    logger.debug("Browser context closed")
+            elif context:
+                context.close()
                 logger.debug("Browser context closed")
     
     def _extract_followers(self, page_content: str) -> Optional[int]:
@@ -124,69 +179,133 @@ class LinkedInCompanyService:
         Returns:
             The number of followers as an integer, or None if not found
         """
-        # Pattern to find "X followers" where X is a number (possibly with commas)
-        patterns = [
-            r'(\d+,?\d*)\s+followers',  # Matches "631 followers" or "1,234 followers"
-            r'followerCount&quot;:(\d+)',  # Matches followerCount JSON value
-            r'followerCount":(\d+)',  # Alternative JSON format
-            r'(\d+,?\d*)\s*follower',  # More general pattern
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, page_content)
-            if match:
-                # Remove commas from the number and convert to int
-                follower_text = match.group(1).replace(',', '')
-                return int(follower_text)
+        # Keep the most preferred match; a "N followers" hit can't be beaten,
+        # so stop scanning there.
+        best_rank, best_text = len(FOLLOWERS_GROUPS), None
+        for match in FOLLOWERS_RE.finditer(page_content):
+            rank = FOLLOWERS_GROUPS.index(match.lastgroup)
+            if rank < best_rank:
+                best_rank, best_text = rank, match.group(match.lastgroup)
+                if rank == 0:
+                    break
+        
+        if best_text is not None:
+            # Remove commas from the number and convert to int
+            return int(best_text.replace(',', ''))
         
         logger.debug("No regex patterns matched for follower count")
         return None
     
+    def _extract_followers_in_page(self, page) -> Optional[int]:
+        """
+        Extract follower count by running the follower regex in the page.
+        
+        Args:
+            page: Playwright page showing the LinkedIn company page
+            
+        Returns:
+            The number of followers as an integer, or None if not found
+        """
+        follower_text = page.evaluate(BEST_MATCH_IN_PAGE_JS, [FOLLOWERS_JS_SOURCE, list(FOLLOWERS_GROUPS)])
+        
+        if follower_text is None:
+            logger.debug("No regex patterns matched for follower count")
+            return None
+        
+        # Remove commas from the number and convert to int
+        return int(follower_text.replace(',', ''))
+    
     def get_all_company_data(self) -> List[Dict[str, Any]]:
         """
         Get follower data for all configured company pages.
         
         Returns:
-            List of dictionaries containing company data with follower counts
+            List of dictionaries containing company data with follower counts,
+            in the same order as company_urls
             
         Note:
-            Processes each company sequentially with a fresh browser instance
+            The pages are spread over up to max_browsers browsers that run
+            concurrently. Each browser is launched once and loads its pages
+            one after another, each in a fresh context and PAGE_SPACING_SECONDS
+            apart
         """
-        results = []
-        
-        for company_url in self.company_urls:
-            try:
-                company_name = self.url_to_name_map.get(company_url, company_url)
-                followers = self.get_company_followers(company_url)
-                
-                company_data = {
-                    "platform": "LinkedIn",
-                    "type": "Company Page",
-                    "name": company_name,
-                    "url": company_url,
-                    "followers": followers if followers is not None else "Not Found",
-                    "timestamp": time.time()
-                }
-                
-                results.append(company_data)
-                
-                # Small delay between companies to avoid rate limiting
-                time.sleep(2)
-                
-            except Exception as e:
-                logger.error(f"Error processing company {company_url}: {str(e)}")
-                # Add failed result with error information
-                results.append({
-                    "platform": "LinkedIn",
-                    "type": "Company Page",
-                    "name": self.url_to_name_map.get(company_url, company_url),
-                    "url": company_url,
-                    "followers": "Not Found",
-                    "error": str(e),
-                    "timestamp": time.time()
-                })
-        
-        return results
+        if not self.company_urls:
+            return []
+        
+        workers = min(self.max_browsers, len(self.company_urls))
+        # Round-robin the pages over the workers; a worker owns one browser
+        shares = [self.company_urls[i::workers] for i in range(workers)]
+        
+        # Playwright's sync objects belong to the thread that created them,
+        # so each browser is launched, used and closed within one worker
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            share_results = list(executor.map(self._get_share_data, shares))
+        
+        results_by_url = {}
+        for share_result in share_results:
+            results_by_url.update(share_result)
+        return [results_by_url[company_url] for company_url in self.company_urls]
+    
+    def _get_share_data(self, company_urls: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch several company pages with one browser.
+        
+        Args:
+            company_urls: URLs of the LinkedIn company pages to fetch
+            
+        Returns:
+            Dictionary mapping each URL to its company data
+        """
+        driver = PlaywrightDriver()
+        try:
+            results = {}
+            for i, company_url in enumerate(company_urls):
+                if i > 0:
+                    # Space the pages out to avoid rate limiting
+                    time.sleep(PAGE_SPACING_SECONDS)
+                results[company_url] = self._get_company_data(company_url, driver)
+            return results
+        finally:
+            driver.close_resources()
+    
+    def _get_company_data(self, company_url: str,
+                          driver: Optional[PlaywrightDriver] = None) -> Dict[str, Any]:
+        """
+        Build the result dictionary for a single company page.
+        
+        Args:
+            company_url: URL of the LinkedIn company page
+            driver: Optional driver whose browser to reuse
+            
+        Returns:
+            Dictionary containing company data, with "Not Found" followers on failure
+        """
+        company_name = self.url_to_name_map.get(company_url, company_url)
+        
+        try:
+            followers = self.get_company_followers(company_url, driver)
+            
+            return {
+                "platform": "LinkedIn",
+                "type": "Company Page",
+                "name": company_name,
+                "url": company_url,
+                "followers": followers if followers is not None else "Not Found",
+                "timestamp": time.time()
+            }
+            
+        except Exception as e:
+            logger.error(f"Error processing company {company_url}: {str(e)}")
+            # Add failed result with error information
+            return {
+                "platform": "LinkedIn",
+                "type": "Company Page",
+                "name": company_name,
+                "url": company_url,
+                "followers": "Not Found",
+                "error": str(e),
+                "timestamp": time.time()
+            }
 
 
 if __name__ == "__main__":
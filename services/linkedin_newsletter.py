@@ -4,20 +4,59 @@ LinkedIn Newsletter Service.
 This module handles retrieving subscriber counts from LinkedIn newsletter pages
 by extracting the data from the HTML response.
 """
-import os, sys
-
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 import re
 import time
 import logging
 from typing import Dict, Any, Optional
+from urllib.parse import urlparse
 
 from config.settings import LKD_NEWSLETTER
-from utils.playwright_driver import PlaywrightDriver
+from utils.playwright_driver import (
+    PlaywrightDriver,
+    BEST_MATCH_IN_PAGE_JS,
+    response_text,
+    wait_for_pattern,
+)
 from utils.exceptions import ScrapingError
+from utils.scraping import anchored_scan_start, fetch_html
 
 logger = logging.getLogger(__name__)
 
+# All subscriber-count patterns fused into one alternation, so the page is
+# scanned once. Alternatives are listed in order of preference:
+#   followers              - "441,469 followers"
+#   subscribers            - "X subscribers"
+#   subscribers_json       - subscribers value, HTML-escaped JSON
+#   subscriber_count_html  - subscriberCount value, HTML-escaped JSON
+#   subscriber_count_json  - subscriberCount value, raw JSON
+#   follower_count_json    - followerCount value, raw JSON
+# Digits are spelled [0-9] rather than compiling with re.ASCII, which would
+# also narrow \s and drop the non-breaking and thin spaces LinkedIn's number
+# formatting puts before the word (JavaScript's \s matches them as well).
+SUBSCRIBERS_RE = re.compile(
+    r'(?P<followers>[0-9,]+)\s+followers'
+    r'|(?P<subscribers>[0-9,]+)\s+subscribers'
+    r'|subscribers&quot;:&quot;(?P<subscribers_json>[0-9,]+)&quot;'
+    r'|subscriberCount&quot;:&quot;(?P<subscriber_count_html>[0-9,]+)&quot;'
+    r'|subscriberCount":"(?P<subscriber_count_json>[0-9,]+)"'
+    r'|followerCount":"(?P<follower_count_json>[0-9,]+)"'
+)
+SUBSCRIBERS_GROUPS = (
+    'followers',
+    'subscribers',
+    'subscribers_json',
+    'subscriber_count_html',
+    'subscriber_count_json',
+    'follower_count_json'
+)
+
+# Literals every alternative contains (see anchored_scan_start)
+SUBSCRIBERS_ANCHORS = ('followers', 'subscribers', 'subscriberCount', 'followerCount')
+
+# The subscriber regex for the in-page checks (see BEST_MATCH_IN_PAGE_JS).
+# JavaScript spells named groups (?<name>...) rather than (?P<name>...).
+SUBSCRIBERS_JS_SOURCE = SUBSCRIBERS_RE.pattern.replace('(?P<', '(?<')
+
 class LinkedInNewsletterService:
     """
     Service for retrieving data from LinkedIn newsletter pages.
@@ -35,38 +74,76 @@ class LinkedInNewsletterService:
                           If None, uses the default URL from settings.
         """
         self.newsletter_url = newsletter_url
+        
+        # Derive the newsletter name from the URL slug (/<section>/<slug>) once
+        self.newsletter_name = "LinkedIn Newsletter"
+        path_parts = urlparse(newsletter_url).path.split('/', 3)
+        if len(path_parts) > 2 and path_parts[2]:
+            self.newsletter_name = path_parts[2].replace('-', ' ').title()
+        
         logger.info(f"LinkedIn Newsletter Service initialized for URL: {newsletter_url}")
     
-    def get_subscribers(self) -> Optional[int]:
+    def get_subscribers(self, driver: Optional[PlaywrightDriver] = None) -> Optional[int]:
         """
         Get the number of subscribers for the LinkedIn newsletter.
         
+        Args:
+            driver: Optional driver whose browser to reuse. The page is still
+                    loaded in a fresh context, which is closed afterwards; the
+                    browser is left running for the caller to close. If None,
+                    a browser is launched for this call alone.
+        
         Returns:
             The number of subscribers as an integer, or None if not found
             
         Raises:
             ScrapingError: If there is an error during the scraping process
         """
-        driver = PlaywrightDriver()
+        # A plain GET is enough when LinkedIn serves the public HTML; the
+        # browser is only launched when it doesn't. Reading
+        # stops at the first match of the top-ranked pattern, which can't be beaten.
+        page_content = fetch_html(self.newsletter_url, SUBSCRIBERS_RE, SUBSCRIBERS_GROUPS[0])
+        if page_content is not None:
+            subscribers = self._extract_subscribers(page_content)
+            if subscribers is not None:
+                logger.info(f"Successfully extracted subscriber count over HTTP: {subscribers}")
+                return subscribers
+            logger.info("No subscriber count in the HTTP response; falling back to the browser")
+        
+        owns_driver = driver is None
+        if owns_driver:
+            driver = PlaywrightDriver()
+        context = None
         
         try:
-            # Initialize browser
-            context = driver.initialize_driver()
+            # Initialize browser; only the HTML is read, so skip images, fonts and the like
+            if owns_driver:
+                context = driver.initialize_driver(block_resources=True)
+            else:
+                context = driver.new_context(block_resources=True)
             page = context.new_page()
             
-            # Navigate to newsletter page
+            # Navigate to newsletter page, returning as soon as the server
+            # answers: the count is usually in the server-rendered HTML, which
+            # can be read off the document response before the page parses it
             logger.info(f"Navigating to LinkedIn newsletter: {self.newsletter_url}")
-            page.goto(self.newsletter_url, timeout=120000)  # 2 minutes timeout
+            response = page.goto(self.newsletter_url, wait_until="commit", timeout=30000)
+            page_content = response_text(response)
+            subscribers = self._extract_subscribers(page_content) if page_content is not None else None
             
-            # Wait for page to load
-            logger.debug("Waiting for page content to load")
-            time.sleep(3)  # Give JavaScript time to load
-            
-            # Extract page content
-            page_content = page.content()
-            
-            # Extract subscriber count
-            subscribers = self._extract_subscribers(page_content)
+            if subscribers is None:
+                # Otherwise let the page reach DOMContentLoaded (not "load",
+                # which waits for every image and tracker) and render the count
+                logger.debug("Waiting for page content to load")
+                page.wait_for_load_state("domcontentloaded", timeout=30000)
+                
+                # Wait for the count to render, capped at the old fixed 3s sleep
+                if not wait_for_pattern(page, SUBSCRIBERS_JS_SOURCE):
+                    logger.debug("No subscriber count rendered yet, reading the page as is")
+                
+                # Extract subscriber count in the page, so the document is not
+                # serialized over to Python
+                subscribers = self._extract_subscribers_in_page(page)
             
             if subscribers is not None:
                 logger.info(f"Successfully extracted subscriber count: {subscribers}")
@@ -82,8 +159,12 @@ class LinkedInNewsletterService:
         
         finally:
             # Clean up resources
-            if 'context' in locals():
-                driver.close(context)
+            if owns_driver:
+                if context:
+                    driver.close(context)
+                    logger.debug("Browser context closed")
+            elif context:
+                context.close()
                 logger.debug("Browser context closed")
     
     def _extract_subscribers(self, page_content: str) -> Optional[int]:
@@ -96,45 +177,63 @@ class LinkedInNewsletterService:
         Returns:
             The number of subscribers as an integer, or None if not found
         """
-        # Pattern to find "X followers" or "X subscribers" where X is a number (possibly with commas)
-        patterns = [
-            r'([\d,]+)\s+followers',  # Matches "441,469 followers"
-            r'([\d,]+)\s+subscribers',  # Matches "X subscribers"
-            r'subscribers&quot;:&quot;([\d,]+)&quot;',  # JSON format in HTML
-            r'subscriberCount&quot;:&quot;([\d,]+)&quot;', # Alternative JSON format
-            r'subscriberCount":"([\d,]+)"',  # Another JSON format
-            r'followerCount":"([\d,]+)"',  # Another JSON format
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, page_content)
-            if match:
-                # Remove commas from the number and convert to int
-                subscriber_text = match.group(1).replace(',', '')
-                return int(subscriber_text)
+        start = anchored_scan_start(page_content, SUBSCRIBERS_ANCHORS)
+        if start is None:
+            logger.debug("No subscriber count markers in the page content")
+            return None
+        
+        # Keep the most preferred match; a "N followers" hit can't be beaten,
+        # so stop scanning there.
+        best_rank, best_text = len(SUBSCRIBERS_GROUPS), None
+        for match in SUBSCRIBERS_RE.finditer(page_content, start):
+            rank = SUBSCRIBERS_GROUPS.index(match.lastgroup)
+            if rank < best_rank:
+                best_rank, best_text = rank, match.group(match.lastgroup)
+                if rank == 0:
+                    break
+        
+        if best_text is not None:
+            # Remove commas from the number and convert to int
+            return int(best_text.replace(',', ''))
         
         logger.debug("No regex patterns matched for subscriber count")
         return None
     
-    def get_newsletter_data(self) -> Dict[str, Any]:
+    def _extract_subscribers_in_page(self, page) -> Optional[int]:
+        """
+        Extract subscriber count by running the subscriber regex in the page.
+        
+        Args:
+            page: Playwright page showing the LinkedIn newsletter
+            
+        Returns:
+            The number of subscribers as an integer, or None if not found
+        """
+        subscriber_text = page.evaluate(BEST_MATCH_IN_PAGE_JS, [SUBSCRIBERS_JS_SOURCE, list(SUBSCRIBERS_GROUPS)])
+        
+        if subscriber_text is None:
+            logger.debug("No regex patterns matched for subscriber count")
+            return None
+        
+        # Remove commas from the number and convert to int
+        return int(subscriber_text.replace(',', ''))
+    
+    def get_newsletter_data(self, driver: Optional[PlaywrightDriver] = None) -> Dict[str, Any]:
         """
         Get complete newsletter data including subscriber count.
         
+        Args:
+            driver: Optional driver whose browser to reuse (see get_subscribers)
+        
         Returns:
             Dictionary containing newsletter data with subscriber count
         """
-        subscribers = self.get_subscribers()
-        
-        # Extract newsletter name from the URL
-        newsletter_name = "LinkedIn Newsletter"
-        url_parts = self.newsletter_url.split('/')
-        if len(url_parts) > 4:
-            newsletter_name = url_parts[4].replace('-', ' ').title()
+        subscribers = self.get_subscribers(driver)
         
         return {
             "platform": "LinkedIn",
             "type": "Newsletter",
-            "name": newsletter_name,
+            "name": self.newsletter_name,
             "url": self.newsletter_url,
             "subscribers": subscribers if subscribers is not None else "Not Found",
             "timestamp": time.time()
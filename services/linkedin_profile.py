@@ -9,17 +9,43 @@ import re
 import time
 import logging
 from typing import Optional, Dict, Any
-import os, sys
-
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-
 
 from config.settings import NICOLAS_LKD_PROFILE
-from utils.playwright_driver import PlaywrightDriver
+from utils.playwright_driver import (
+    PlaywrightDriver,
+    BEST_MATCH_IN_PAGE_JS,
+    response_text,
+    wait_for_pattern,
+)
 from utils.exceptions import ScrapingError
+from utils.scraping import anchored_scan_start, fetch_html
 
 logger = logging.getLogger(__name__)
 
+# All follower-count patterns fused into one alternation, so the page is
+# scanned once. Alternatives are listed in order of preference:
+#   interaction - "Follows" userInteractionCount in the JSON-LD block
+#   json        - followerCount JSON value
+#   text        - "1,234 followers" (older LinkedIn format)
+FOLLOWERS_RE = re.compile(
+    r'"name":"Follows","userInteractionCount":(?P<interaction>[0-9]+)'
+    r'|followerCount":(?P<json>[0-9]+)'
+    r'|(?P<text>[0-9]+,?[0-9]*) followers'
+)
+FOLLOWERS_GROUPS = ('interaction', 'json', 'text')
+
+# Literals every alternative contains (see anchored_scan_start)
+FOLLOWERS_ANCHORS = ('"name":"Follows"', 'followerCount"', ' followers')
+
+# The preferred value sits behind this fixed key, so its digits can be read
+# straight off with an anchored match instead of scanning the alternation.
+FOLLOWS_INTERACTION_KEY = '"name":"Follows","userInteractionCount":'
+DIGITS_RE = re.compile(r'\d+', re.ASCII)
+
+# The follower regex for the in-page checks (see BEST_MATCH_IN_PAGE_JS).
+# JavaScript spells named groups (?<name>...) rather than (?P<name>...).
+FOLLOWERS_JS_SOURCE = FOLLOWERS_RE.pattern.replace('(?P<', '(?<')
+
 class LinkedInProfileService:
     """
     Service for retrieving data from LinkedIn personal profiles.
@@ -42,79 +68,117 @@ class LinkedInProfileService:
         self.retry_wait_seconds = retry_wait_seconds
         logger.info(f"LinkedIn Profile Service initialized for URL: {profile_url}")
     
-    def get_followers(self) -> Optional[int]:
+    def get_followers(self, driver: Optional[PlaywrightDriver] = None) -> Optional[int]:
         """
         Get the number of followers for the LinkedIn profile.
         
+        Args:
+            driver: Optional driver whose browser to reuse. Each attempt still
+                    loads the page in a fresh context, which is closed
+                    afterwards; the browser is left running for the caller to
+                    close. If None, a browser is launched for this call alone.
+        
         Returns:
             The number of followers as an integer, or None if not found.
             
         Raises:
             ScrapingError: If there is an error during the scraping process.
         """
-        retries = 0
+        # A plain GET is enough when LinkedIn serves the public HTML; the
+        # browser is only launched when it doesn't. Reading
+        # stops at the first match of the top-ranked pattern, which can't be beaten.
+        page_content = fetch_html(self.profile_url, FOLLOWERS_RE, FOLLOWERS_GROUPS[0])
+        if page_content is not None:
+            followers = self._extract_followers(page_content)
+            if followers is not None:
+                logger.info(f"Successfully extracted follower count over HTTP: {followers}")
+                return followers
+            logger.info("No follower count in the HTTP response; falling back to the browser")
         
-        while retries <= self.max_retries:
-            # Create a fresh driver instance for each attempt
+        owns_driver = driver is None
+        if owns_driver:
             driver = PlaywrightDriver()
-            context = None
-            
-            try:
-                # Initialize browser
-                context = driver.initialize_driver()
-                page = context.new_page()
-                
-                # Navigate to profile page
-                logger.info(f"Navigating to LinkedIn profile: {self.profile_url} (Attempt {retries + 1}/{self.max_retries + 1})")
-                page.goto(self.profile_url, timeout=120000)  # 2 minutes timeout
-                
-                # Wait for page to load
-                logger.debug("Waiting for page content to load")
-                time.sleep(3)  # Give JavaScript time to load
-                
-                # Extract page content
-                page_content = page.content()
-                
-                # Extract followers count
-                followers = self._extract_followers(page_content)
-                
-                if followers is not None:
-                    logger.info(f"Successfully extracted follower count: {followers}")
-                    # Clean up resources before returning
-                    driver.close(context)
-                    return followers
-                
-                logger.warning(f"Could not find follower count (Attempt {retries + 1}/{self.max_retries + 1})")
-                
-                # Clean up resources before potential retry
-                driver.close(context)
-                
-                # If we've reached max retries, return None
-                if retries == self.max_retries:
-                    logger.warning(f"Could not find follower count after {retries + 1} attempts")
-                    return None
-                
-                # Increment retry counter and wait before next attempt
-                retries += 1
-                logger.info(f"Retrying in {self.retry_wait_seconds} seconds (Attempt {retries + 1}/{self.max_retries + 1})")
-                time.sleep(self.retry_wait_seconds)
-                
-            except Exception as e:
-                error_msg = f"Error scraping LinkedIn profile: {str(e)}"
-                logger.error(error_msg)
-                
-                # Clean up resources
-                if context:
-                    driver.close(context)
-                
-                # If we've reached max retries, raise the error
-                if retries == self.max_retries:
-                    raise ScrapingError(error_msg)
+        retries = 0
+        
+        try:
+            while retries <= self.max_retries:
+                context = None
                 
-                # Increment retry counter and wait before next attempt
-                retries += 1
-                logger.info(f"Error occurred. Retrying in {self.retry_wait_seconds} seconds (Attempt {retries + 1}/{self.max_retries + 1})")
-                time.sleep(self.retry_wait_seconds)
+                try:
+                    # The browser is launched once; each attempt gets a fresh
+                    # context. Only the HTML is read, so skip images, fonts and the like
+                    context = driver.new_context(block_resources=True)
+                    page = context.new_page()
+                    
+                    # Navigate to profile page, returning as soon as the server
+                    # answers: the count is usually in the server-rendered HTML,
+                    # which can be read off the document response before the
+                    # page parses it
+                    logger.info(f"Navigating to LinkedIn profile: {self.profile_url} (Attempt {retries + 1}/{self.max_retries + 1})")
+                    response = page.goto(self.profile_url, wait_until="commit", timeout=30000)
+                    page_content = response_text(response)
+                    followers = self._extract_followers(page_content) if page_content is not None else None
+                    
+                    if followers is None:
+                        # Otherwise let the page reach DOMContentLoaded (not
+                        # "load", which waits for every image and tracker) and
+                        # render the count
+                        logger.debug("Waiting for page content to load")
+                        page.wait_for_load_state("domcontentloaded", timeout=30000)
+                        
+                        # Wait for the count to render, capped at the old fixed 3s sleep
+                        if not wait_for_pattern(page, FOLLOWERS_JS_SOURCE):
+                            logger.debug("No follower count rendered yet, reading the page as is")
+                        
+                        # Extract followers count in the page, so the document
+                        # is not serialized over to Python
+                        followers = self._extract_followers_in_page(page)
+                    
+                    # Clean up the context before returning or retrying
+                    context.close()
+                    
+                    if followers is not None:
+                        logger.info(f"Successfully extracted follower count: {followers}")
+                        return followers
+                    
+                    logger.warning(f"Could not find follower count (Attempt {retries + 1}/{self.max_retries + 1})")
+                    
+                    # If we've reached max retries, return None
+                    if retries == self.max_retries:
+                        logger.warning(f"Could not find follower count after {retries + 1} attempts")
+                        return None
+                    
+                    # Increment retry counter and wait before next attempt
+                    retries += 1
+                    logger.info(f"Retrying in {self.retry_wait_seconds} seconds (Attempt {retries + 1}/{self.max_retries + 1})")
+                    time.sleep(self.retry_wait_seconds)
+                    
+                except Exception as e:
+                    error_msg = f"Error scraping LinkedIn profile: {str(e)}"
+                    logger.error(error_msg)
+                    
+                    # Clean up resources; a browser we own is relaunched on the
+                    # next attempt in case it is what failed
+                    if context:
+                        try:
+                            context.close()
+                        except Exception:
+                            pass
+                    if owns_driver:
+                        driver.close_resources()
+                    
+                    # If we've reached max retries, raise the error
+                    if retries == self.max_retries:
+                        raise ScrapingError(error_msg)
+                    
+                    # Increment retry counter and wait before next attempt
+                    retries += 1
+                    logger.info(f"Error occurred. Retrying in {self.retry_wait_seconds} seconds (Attempt {retries + 1}/{self.max_retries + 1})")
+                    time.sleep(self.retry_wait_seconds)
+        
+        finally:
+            if owns_driver:
+                driver.close_resources()
         
         # This point should never be reached due to the return and raise statements above
         return None
@@ -129,33 +193,64 @@ class LinkedInProfileService:
         Returns:
             The number of followers as an integer, or None if not found
         """
-        # Primary pattern for follower count
-        primary_match = re.search(r'"name":"Follows","userInteractionCount":(\d+)', page_content)
-        if primary_match:
-            return int(primary_match.group(1))
-        
-        # Fallback pattern
-        fallback_match = re.search(r'followerCount":(\d+)', page_content)
-        if fallback_match:
-            return int(fallback_match.group(1))
-        
-        # Second fallback for older LinkedIn format
-        text_match = re.search(r'(\d+,?\d*) followers', page_content)
-        if text_match:
-            follower_text = text_match.group(1).replace(',', '')
-            return int(follower_text)
+        key_at = page_content.find(FOLLOWS_INTERACTION_KEY)
+        if key_at >= 0:
+            digits = DIGITS_RE.match(page_content, key_at + len(FOLLOWS_INTERACTION_KEY))
+            if digits:
+                return int(digits.group())
+        
+        start = anchored_scan_start(page_content, FOLLOWERS_ANCHORS)
+        if start is None:
+            logger.debug("No follower count markers in the page content")
+            return None
+        
+        # Keep the most preferred match; the userInteractionCount hit can't be
+        # beaten, so stop scanning there.
+        best_rank, best_text = len(FOLLOWERS_GROUPS), None
+        for match in FOLLOWERS_RE.finditer(page_content, start):
+            rank = FOLLOWERS_GROUPS.index(match.lastgroup)
+            if rank < best_rank:
+                best_rank, best_text = rank, match.group(match.lastgroup)
+                if rank == 0:
+                    break
+        
+        if best_text is not None:
+            # Remove commas from the number and convert to int
+            return int(best_text.replace(',', ''))
             
         logger.debug("No regex patterns matched for follower count")
         return None
     
-    def get_profile_data(self) -> Dict[str, Any]:
+    def _extract_followers_in_page(self, page) -> Optional[int]:
+        """
+        Extract follower count by running the follower regex in the page.
+        
+        Args:
+            page: Playwright page showing the LinkedIn profile
+            
+        Returns:
+            The number of followers as an integer, or None if not found
+        """
+        follower_text = page.evaluate(BEST_MATCH_IN_PAGE_JS, [FOLLOWERS_JS_SOURCE, list(FOLLOWERS_GROUPS)])
+        
+        if follower_text is None:
+            logger.debug("No regex patterns matched for follower count")
+            return None
+        
+        # Remove commas from the number and convert to int
+        return int(follower_text.replace(',', ''))
+    
+    def get_profile_data(self, driver: Optional[PlaywrightDriver] = None) -> Dict[str, Any]:
         """
         Get all profile data including follower count.
         
+        Args:
+            driver: Optional driver whose browser to reuse (see get_followers)
+        
         Returns:
             Dictionary containing profile data with follower count
         """
-        followers = self.get_followers()
+        followers = self.get_followers(driver)
         
         return {
             "platform": "LinkedIn",
@@ -9,15 +9,22 @@ import re
 import time
 import logging
 from typing import Optional, Dict, Any
-import os, sys
-
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from utils.playwright_driver import PlaywrightDriver
 from utils.exceptions import ScrapingError
+from utils.scraping import anchored_scan_start
 
 logger = logging.getLogger(__name__)
 
+# Follower-count patterns, compiled once at import
+FOLLOWER_COUNT_JSON_RE = re.compile(r'"follower_count"\s*:\s*(\d+)')
+FOLLOWER_COUNT_CAMEL_RE = re.compile(r'"followerCount"\s*:\s*(\d+)')
+FOLLOWERS_TEXT_RE = re.compile(r'([\d,]+)\s+followers')
+
+# Every pattern above contains this literal, so the regexes start searching
+# at its first occurrence (see anchored_scan_start)
+FOLLOWER_ANCHORS = ('follower',)
+
 
 class ThreadsProfileService:
     """
@@ -41,66 +48,88 @@ class ThreadsProfileService:
         self.retry_wait_seconds = retry_wait_seconds
         logger.info(f"Threads Profile Service initialized for URL: {profile_url}")
 
-    def get_followers(self) -> Optional[int]:
+    def get_followers(self, driver: Optional[PlaywrightDriver] = None) -> Optional[int]:
         """
         Get the number of followers for the Threads profile.
 
+        Args:
+            driver: Optional driver whose browser to reuse. Each attempt still
+                    loads the page in a fresh context, which is closed
+                    afterwards; the browser is left running for the caller to
+                    close. If None, a browser is launched for this call alone.
+
         Returns:
             The number of followers as an integer, or None if not found.
 
         Raises:
             ScrapingError: If there is an error during the scraping process.
         """
+        owns_driver = driver is None
+        if owns_driver:
+            driver = PlaywrightDriver()
         retries = 0
 
-        while retries <= self.max_retries:
-            driver = PlaywrightDriver()
-            context = None
+        try:
+            while retries <= self.max_retries:
+                context = None
+
+                try:
+                    # The browser is launched once; each attempt gets a fresh
+                    # context. Only the HTML is read, so skip images, fonts and the like
+                    context = driver.new_context(block_resources=True)
+                    page = context.new_page()
 
-            try:
-                context = driver.initialize_driver()
-                page = context.new_page()
+                    logger.info(f"Navigating to Threads profile: {self.profile_url} (Attempt {retries + 1}/{self.max_retries + 1})")
+                    page.goto(self.profile_url, timeout=120000)
 
-                logger.info(f"Navigating to Threads profile: {self.profile_url} (Attempt {retries + 1}/{self.max_retries + 1})")
-                page.goto(self.profile_url, timeout=120000)
+                    logger.debug("Waiting for page content to load")
+                    time.sleep(3)
 
-                logger.debug("Waiting for page content to load")
-                time.sleep(3)
+                    page_content = page.content()
 
-                page_content = page.content()
+                    followers = self._extract_followers(page_content)
 
-                followers = self._extract_followers(page_content)
+                    # Clean up the context before returning or retrying
+                    context.close()
 
-                if followers is not None:
-                    logger.info(f"Successfully extracted follower count: {followers}")
-                    driver.close(context)
-                    return followers
+                    if followers is not None:
+                        logger.info(f"Successfully extracted follower count: {followers}")
+                        return followers
 
-                logger.warning(f"Could not find follower count (Attempt {retries + 1}/{self.max_retries + 1})")
+                    logger.warning(f"Could not find follower count (Attempt {retries + 1}/{self.max_retries + 1})")
 
-                driver.close(context)
+                    if retries == self.max_retries:
+                        logger.warning(f"Could not find follower count after {retries + 1} attempts")
+                        return None
 
-                if retries == self.max_retries:
-                    logger.warning(f"Could not find follower count after {retries + 1} attempts")
-                    return None
+                    retries += 1
+                    logger.info(f"Retrying in {self.retry_wait_seconds} seconds (Attempt {retries + 1}/{self.max_retries + 1})")
+                    time.sleep(self.retry_wait_seconds)
 
-                retries += 1
-                logger.info(f"Retrying in {self.retry_wait_seconds} seconds (Attempt {retries + 1}/{self.max_retries + 1})")
-                time.sleep(self.retry_wait_seconds)
+                except Exception as e:
+                    error_msg = f"Error scraping Threads profile: {str(e)}"
+                    logger.error(error_msg)
 
-            except Exception as e:
-                error_msg = f"Error scraping Threads profile: {str(e)}"
-                logger.error(error_msg)
+                    # Clean up resources; a browser we own is relaunched on the
+                    # next attempt in case it is what failed
+                    if context:
+                        try:
+                            context.close()
+                        except Exception:
+                            pass
+                    if owns_driver:
+                        driver.close_resources()
 
-                if context:
-                    driver.close(context)
+                    if retries == self.max_retries:
+                        raise ScrapingError(error_msg)
 
-                if retries == self.max_retries:
-                    raise ScrapingError(error_msg)
+                    retries += 1
+                    logger.info(f"Error occurred. Retrying in {self.retry_wait_seconds} seconds (Attempt {retries + 1}/{self.max_retries + 1})")
+                    time.sleep(self.retry_wait_seconds)
 
-                retries += 1
-                logger.info(f"Error occurred. Retrying in {self.retry_wait_seconds} seconds (Attempt {retries + 1}/{self.max_retries + 1})")
-                time.sleep(self.retry_wait_seconds)
+        finally:
+            if owns_driver:
+                driver.close_resources()
 
         return None
 
@@ -114,32 +143,40 @@ class ThreadsProfileService:
         Returns:
             The number of followers as an integer, or None if not found
         """
+        start = anchored_scan_start(page_content, FOLLOWER_ANCHORS)
+        if start is None:
+            logger.debug("No follower count markers in the page content")
+            return None
+
         # Primary pattern — embedded JSON in script tags
-        primary_match = re.search(r'"follower_count"\s*:\s*(\d+)', page_content)
+        primary_match = FOLLOWER_COUNT_JSON_RE.search(page_content, start)
         if primary_match:
             return int(primary_match.group(1))
 
         # Fallback — older or alternate JSON key
-        fallback_match = re.search(r'"followerCount"\s*:\s*(\d+)', page_content)
+        fallback_match = FOLLOWER_COUNT_CAMEL_RE.search(page_content, start)
         if fallback_match:
             return int(fallback_match.group(1))
 
         # Second fallback — rendered text (e.g. "2,133 followers")
-        text_match = re.search(r'([\d,]+)\s+followers', page_content)
+        text_match = FOLLOWERS_TEXT_RE.search(page_content, start)
         if text_match:
             return int(text_match.group(1).replace(',', ''))
 
         logger.debug("No regex patterns matched for follower count")
         return None
 
-    def get_profile_data(self) -> Dict[str, Any]:
+    def get_profile_data(self, driver: Optional[PlaywrightDriver] = None) -> Dict[str, Any]:
         """
         Get all profile data including follower count.
 
+        Args:
+            driver: Optional driver whose browser to reuse (see get_followers)
+
         Returns:
             Dictionary containing profile data with follower count
         """
-        followers = self.get_followers()
+        followers = self.get_followers(driver)
 
         return {
             "platform": "Threads",
@@ -1,7 +1,8 @@
-import sys, os, re, json, time
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import re, json, time
 from utils.playwright_driver import PlaywrightDriver
 
+INTERACTION_COUNT_RE = re.compile(r'"userInteractionCount":(\d+)')
+
 class TikTok:
     def __init__(self):
         self.base_url = 'https://www.tiktok.com/@nicolasboucherofficial?_r=1&_t=ZS-92tjkJvDnZB'
@@ -10,7 +11,8 @@ class TikTok:
     def get_metrics(self):
         """Fetch TikTok followers and likes using Playwright."""
         driver = PlaywrightDriver(cookies_file=self.cookies_file)
-        context = driver.initialize_driver()
+        # Only the HTML is read, so skip images, fonts and the like
+        context = driver.initialize_driver(block_resources=True)
         page = context.new_page()
 
         try:
@@ -45,7 +47,7 @@ class TikTok:
             return None
 
         try:
-            matches = re.findall(r'"userInteractionCount":(\d+)', page_content)
+            matches = INTERACTION_COUNT_RE.findall(page_content)
             if len(matches) >= 2:
                 return int(matches[0]), int(matches[1]) 
 
@@ -3,22 +3,83 @@ Twitter (X) Service.
 
 This module handles retrieving follower counts from Twitter (X) using the Twitter API.
 """
-import os, sys
-
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-
 import time
+import random
 import logging
 import requests
-from typing import Dict, Any, Optional
+from email.utils import parsedate_to_datetime
+from typing import Dict, Any, Optional, Tuple
 
 from config.settings import TWITTER_USERNAME, TWITTER_API_ENDPOINT, TWITTER_BEARER_TOKEN
 from utils.exceptions import APIError, RateLimitError
+from utils.json_utils import json_loads
 
 
 
 logger = logging.getLogger(__name__)
 
+# Twitter's rate-limit window; also the wait used when the response does not
+# say when the limit resets.
+RATE_LIMIT_WINDOW_SECONDS = 900
+
+
+def _rate_limit_wait(response: requests.Response) -> float:
+    """
+    Seconds to wait before retrying a rate-limited request.
+    
+    Uses the x-rate-limit-reset header (epoch seconds) or Retry-After
+    (seconds or an HTTP date) when present, so the retry happens as soon as
+    the window reopens, clamped to one full window.
+    
+    Args:
+        response: The 429 response
+        
+    Returns:
+        Seconds to sleep, between 1 and RATE_LIMIT_WINDOW_SECONDS
+    """
+    wait = None
+    reset = response.headers.get('x-rate-limit-reset')
+    retry_after = response.headers.get('retry-after')
+    
+    try:
+        if reset is not None:
+            wait = float(reset) - time.time()
+        elif retry_after is not None:
+            try:
+                wait = float(retry_after)
+            except ValueError:
+                wait = parsedate_to_datetime(retry_after).timestamp() - time.time()
+    except (TypeError, ValueError, OverflowError):
+        wait = None
+    
+    if wait is None:
+        return RATE_LIMIT_WINDOW_SECONDS
+    # One extra second so we land after the reset rather than on it
+    return min(max(wait + 1, 1), RATE_LIMIT_WINDOW_SECONDS)
+
+
+# Attempts per get_followers call when retrying, and the exponential backoff
+# (base * 2**attempt, capped, plus jitter) between attempts that failed for
+# transient reasons: network errors, 5xx responses, missing follower data.
+MAX_ATTEMPTS = 5
+BACKOFF_BASE_SECONDS = 1
+BACKOFF_CAP_SECONDS = 60
+BACKOFF_JITTER_SECONDS = 1
+
+
+def _backoff(attempt: int, reason: str) -> None:
+    """
+    Sleep before retrying a request that failed for a transient reason.
+    
+    Args:
+        attempt: Zero-based number of the attempt that just failed
+        reason: Short description of the failure, for the log
+    """
+    wait = min(BACKOFF_CAP_SECONDS, BACKOFF_BASE_SECONDS * 2 ** attempt)
+    wait += random.uniform(0, BACKOFF_JITTER_SECONDS)
+    logger.info(f"{reason}. Retrying in {wait:.1f} seconds (attempt {attempt + 2}/{MAX_ATTEMPTS})...")
+    time.sleep(wait)
+
 class TwitterService:
     """
     Service for retrieving data from Twitter (X) API.
@@ -26,7 +87,12 @@ class TwitterService:
     This service fetches follower metrics for Twitter accounts using the Twitter API.
     """
     
-    def __init__(self, username: str = TWITTER_USERNAME, bearer_token: Optional[str] = None):
+    # How long a successful lookup is reused for (seconds). Follower counts
+    # move slowly, and the endpoint's rate limit is tight.
+    CACHE_TTL_SECONDS = 60
+    
+    def __init__(self, username: str = TWITTER_USERNAME, bearer_token: Optional[str] = None,
+                 session: Optional[requests.Session] = None):
         """
         Initialize the Twitter Service.
         
@@ -34,9 +100,17 @@ class TwitterService:
             username: Twitter username to fetch data for
             bearer_token: Twitter API bearer token for authentication.
                          If None, uses the token from environment variables.
+            session: Optional session to send requests through. If None, the
+                     service creates its own, so repeated polls (and the
+                     retry) reuse one keep-alive connection.
         """
         self.username = username
         self.bearer_token = bearer_token or TWITTER_BEARER_TOKEN
+        self.session = session or requests.Session()
+        self.endpoint = f"https://api.twitter.com/2/users/by/username/{username}?user.fields=public_metrics"
+        self.headers = {"Authorization": f"Bearer {self.bearer_token}"}
+        # (monotonic fetch time, result) of the last successful lookup
+        self._cache: Optional[Tuple[float, Dict[str, Any]]] = None
         
         if not self.bearer_token:
             logger.warning("No Twitter bearer token provided. API calls will likely fail.")
@@ -48,7 +122,10 @@ class TwitterService:
             Get the number of followers for the Twitter account.
             
             Args:
-                retry_on_failure: If True, wait 15 minutes and retry once if the initial request fails
+                retry_on_failure: If True, retry failed requests, up to MAX_ATTEMPTS
+                                  attempts. Transient failures back off
+                                  exponentially with jitter; a rate limit is
+                                  waited out once, for as long as the API asks.
                 
             Returns:
                 Dictionary containing follower data
@@ -57,112 +134,118 @@ class TwitterService:
                 APIError: If there is an error with the API request
                 RateLimitError: If Twitter API rate limit is reached
             """
-            url = f"https://api.twitter.com/2/users/by/username/{self.username}?user.fields=public_metrics"
-            headers = {"Authorization": f"Bearer {self.bearer_token}"}
+            if self._cache and time.monotonic() - self._cache[0] < self.CACHE_TTL_SECONDS:
+                logger.info(f"Using cached Twitter data for username: {self.username}")
+                return dict(self._cache[1])
             
-            try:
-                logger.info(f"Fetching Twitter data for username: {self.username}")
-                response = requests.get(url, headers=headers, timeout=30)
+            attempts = MAX_ATTEMPTS if retry_on_failure else 1
+            rate_limit_waited = False
+            error_msg = None
+            
+            for attempt in range(attempts):
+                can_retry = attempt < attempts - 1
                 
-                # Check for rate limiting
-                if response.status_code == 429:
-                    reset_time = response.headers.get('x-rate-limit-reset', 'unknown')
-                    error_msg = f"Twitter API rate limit exceeded. Reset at: {reset_time}"
-                    logger.error(error_msg)
+                try:
+                    logger.info(f"Fetching Twitter data for username: {self.username}")
+                    response = self.session.get(self.endpoint, headers=self.headers, timeout=30)
+                    # One timestamp for the result, taken when the response arrived
+                    fetched_at = time.time()
                     
-                    if retry_on_failure:
-                        logger.info("Rate limit hit. Waiting 15 minutes before retry...")
-                        time.sleep(900)  # Wait 15 minutes (900 seconds)
-                        logger.info("Retrying Twitter API request after waiting...")
-                        return self.get_followers(retry_on_failure=False)  # Retry once
+                    # Check for rate limiting
+                    if response.status_code == 429:
+                        reset_time = response.headers.get('x-rate-limit-reset', 'unknown')
+                        error_msg = f"Twitter API rate limit exceeded. Reset at: {reset_time}"
+                        logger.error(error_msg)
+                        
+                        if can_retry and not rate_limit_waited:
+                            wait_seconds = _rate_limit_wait(response)
+                            logger.info(f"Rate limit hit. Waiting {wait_seconds:.0f} seconds before retry...")
+                            time.sleep(wait_seconds)
+                            rate_limit_waited = True
+                            continue
+                        
+                        raise RateLimitError(error_msg, status_code=429, response=response.text)
                     
-                    raise RateLimitError(error_msg, status_code=429, response=response.text)
-                
-                # Check for other API errors
-                if response.status_code != 200:
-                    error_msg = f"Twitter API returned error: {response.status_code} - {response.text}"
-                    logger.error(error_msg)
+                    # Check for other API errors
+                    if response.status_code != 200:
+                        error_msg = f"Twitter API returned error: {response.status_code} - {response.text}"
+                        logger.error(error_msg)
+                        
+                        # Client errors (bad token, unknown user) won't go away on retry
+                        if can_retry and response.status_code >= 500:
+                            _backoff(attempt, "API error")
+                            continue
+                        
+                        raise APIError(error_msg, status_code=response.status_code, response=response.text)
                     
-                    if retry_on_failure:
-                        logger.info("API error. Waiting 15 minutes before retry...")
-                        time.sleep(900)  # Wait 15 minutes (900 seconds)
-                        logger.info("Retrying Twitter API request after waiting...")
-                        return self.get_followers(retry_on_failure=False)  # Retry once
+                    data = json_loads(response.content)
                     
-                    raise APIError(error_msg, status_code=response.status_code, response=response.text)
-                
-                data = response.json()
-                
-                # Extract follower count from response
-                if "data" in data and "public_metrics" in data["data"]:
-                    followers_count = data["data"]["public_metrics"].get("followers_count", 0)
-                    logger.info(f"Successfully fetched follower count for {self.username}: {followers_count}")
+                    # Extract follower count from response
+                    if "data" in data and "public_metrics" in data["data"]:
+                        followers_count = data["data"]["public_metrics"].get("followers_count", 0)
+                        logger.info(f"Successfully fetched follower count for {self.username}: {followers_count}")
+                        
+                        result = self._result(followers_count, timestamp=fetched_at,
+                                              raw_metrics=data["data"]["public_metrics"])
+                        self._cache = (time.monotonic(), result)
+                        return dict(result)
                     
-                    return {
-                        "platform": "Twitter",
-                        "username": self.username,
-                        "followers": followers_count,
-                        "timestamp": time.time(),
-                        "raw_metrics": data["data"]["public_metrics"]
-                    }
-                else:
+                    error_msg = "No follower data in response"
                     logger.warning(f"Could not find followers data in API response for {self.username}")
-                    logger.debug(f"Response data: {data}")
+                    logger.debug("Response data: %s", data)
                     
-                    if retry_on_failure:
-                        logger.info("No follower data in response. Waiting 15 minutes before retry...")
-                        time.sleep(900)  # Wait 15 minutes (900 seconds)
-                        logger.info("Retrying Twitter API request after waiting...")
-                        return self.get_followers(retry_on_failure=False)  # Retry once
+                    if can_retry:
+                        _backoff(attempt, "No follower data in response")
+                        continue
                     
-                    return {
-                        "platform": "Twitter",
-                        "username": self.username,
-                        "followers": "Not Found",
-                        "timestamp": time.time(),
-                        "error": "No follower data in response"
-                    }
+                    return self._result("Not Found", timestamp=fetched_at, error=error_msg)
+                        
+                except requests.RequestException as e:
+                    error_msg = f"Network error when fetching Twitter data: {str(e)}"
+                    logger.error(error_msg)
                     
-            except (requests.RequestException, requests.Timeout) as e:
-                error_msg = f"Network error when fetching Twitter data: {str(e)}"
-                logger.error(error_msg)
-                
-                if retry_on_failure:
-                    logger.info("Network error. Waiting 15 minutes before retry...")
-                    time.sleep(900)  # Wait 15 minutes (900 seconds)
-                    logger.info("Retrying Twitter API request after waiting...")
-                    return self.get_followers(retry_on_failure=False)  # Retry once
-                
-                return {
-                    "platform": "Twitter",
-                    "username": self.username,
-                    "followers": "Not Found",
-                    "timestamp": time.time(),
-                    "error": error_msg
-                }
-                
-            except (APIError, RateLimitError) as e:
-                # These errors should already have been handled with a retry if retry_on_failure was True
-                # Re-raise them for the caller
-                raise
-                
-            except Exception as e:
-                error_msg = f"Unexpected error fetching Twitter data: {str(e)}"
-                logger.error(error_msg)
-                
-                if retry_on_failure:
-                    logger.info("Unexpected error. Waiting 15 minutes before retry...")
-                    time.sleep(900)  # Wait 15 minutes (900 seconds)
-                    logger.info("Retrying Twitter API request after waiting...")
-                    return self.get_followers(retry_on_failure=False)  # Retry once
-                
-                return {
-                    "platform": "Twitter",
-                    "username": self.username,
-                    "followers": "Not Found",
-                    "timestamp": time.time(),
-                    "error": error_msg
-                }
+                    if can_retry:
+                        _backoff(attempt, "Network error")
+                        continue
+                    
+                    return self._result("Not Found", error=error_msg)
+                    
+                except (APIError, RateLimitError):
+                    # Retries, if any, have already been spent; re-raise for the caller
+                    raise
+                    
+                except Exception as e:
+                    error_msg = f"Unexpected error fetching Twitter data: {str(e)}"
+                    logger.error(error_msg)
+                    
+                    if can_retry:
+                        _backoff(attempt, "Unexpected error")
+                        continue
+                    
+                    return self._result("Not Found", error=error_msg)
+            
+            # Not reached: the last attempt always returns or raises
+            return self._result("Not Found", error=error_msg)
+    
+    def _result(self, followers: Any, timestamp: Optional[float] = None, **extra: Any) -> Dict[str, Any]:
+        """
+        Build the result dictionary for this account.
+        
+        Args:
+            followers: Follower count, or "Not Found" on failure
+            timestamp: When the data was fetched. If None, the current time.
+            **extra: Additional fields, e.g. raw_metrics or error
+            
+        Returns:
+            Dictionary containing follower data
+        """
+        return {
+            "platform": "Twitter",
+            "username": self.username,
+            "followers": followers,
+            "timestamp": timestamp if timestamp is not None else time.time(),
+            **extra
+        }
     
     def get_account_data(self) -> Dict[str, Any]:
         """
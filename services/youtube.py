@@ -4,21 +4,27 @@ YouTube Service.
 This module handles retrieving subscriber and view counts from YouTube
 using the YouTube Data API.
 """
-import os, sys
-
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import os
 import time
 import logging
 import requests
-import json
-import os
-from typing import Dict, Any, Optional
+import threading
+from typing import Dict, Any, Optional, Tuple
+
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-from config.settings import YOUTUBE_STATS_ENDPOINT, YT_API_KEY, YT_CHANNEL_ID
+from config.settings import YT_API_KEY, YT_CHANNEL_ID, youtube_stats_endpoint
 from utils.exceptions import APIError, RateLimitError
+from utils.json_utils import json_loads
 
 logger = logging.getLogger(__name__)
 
+# Backup file of the latest stats, and the lock that keeps background writes
+# to it from interleaving
+STATS_FILE = "data/youtube_stats.txt"
+_stats_file_lock = threading.Lock()
+
 class YouTubeService:
     """
     Service for retrieving data from YouTube.
@@ -26,178 +32,192 @@ class YouTubeService:
     This service fetches subscriber and view counts from the YouTube Data API.
     """
     
-    def __init__(self, api_key: Optional[str] = None, channel_id: Optional[str] = None):
+    # How long a successful lookup is reused for (seconds). The counts move
+    # slowly, and every call spends Data API quota.
+    CACHE_TTL_SECONDS = 60
+    
+    def __init__(self, api_key: Optional[str] = None, channel_id: Optional[str] = None,
+                 session: Optional[requests.Session] = None, max_retries: int = 3):
         """
         Initialize the YouTube Service.
         
         Args:
             api_key: YouTube API key for authentication. If None, uses the key from settings.
             channel_id: YouTube channel ID. If None, uses the ID from settings.
+            session: Optional session to send requests through. If None, the
+                     service creates its own, so retries and repeated polls
+                     reuse one keep-alive connection.
+            max_retries: Maximum number of retries for connection errors and
+                         429/5xx responses, with exponential backoff. Only
+                         applies to the session the service creates itself;
+                         a passed-in session keeps its own retry policy.
+            
+        Raises:
+            ValueError: If no API key or channel ID is available at all.
         """
         self.api_key = api_key or YT_API_KEY
         self.channel_id = channel_id or YT_CHANNEL_ID
-        
-        # Build the endpoint URL
-        if self.api_key and self.channel_id:
-            self.endpoint = f'https://www.googleapis.com/youtube/v3/channels?part=statistics&id={self.channel_id}&key={self.api_key}'
-        else:
-            self.endpoint = YOUTUBE_STATS_ENDPOINT
+        if session is None:
+            session = requests.Session()
+            retry = Retry(
+                total=max_retries,
+                backoff_factor=1,
+                status_forcelist=(429, 500, 502, 503, 504),
+                allowed_methods=frozenset({"GET"}),
+                respect_retry_after_header=True,
+                raise_on_status=False  # hand the last response back to get_channel_stats
+            )
+            session.mount("https://", HTTPAdapter(max_retries=retry))
+        self.session = session
+        # (monotonic fetch time, result) of the last successful lookup
+        self._cache: Optional[Tuple[float, Dict[str, Any]]] = None
         
         if not self.api_key:
             logger.warning("No YouTube API key provided. API calls will likely fail.")
             
         if not self.channel_id:
             logger.warning("No YouTube channel ID provided. API calls will likely fail.")
+        
+        # Build the endpoint URL. Without both values this falls back to the
+        # environment, which raises ValueError instead of building a URL
+        # containing "None".
+        if self.api_key and self.channel_id:
+            self.endpoint = f'https://www.googleapis.com/youtube/v3/channels?part=statistics&id={self.channel_id}&key={self.api_key}'
+        else:
+            self.endpoint = youtube_stats_endpoint()
             
         logger.info(f"YouTube Service initialized for channel ID: {self.channel_id}")
     
-    def get_channel_stats(self, max_retries: int = 3) -> Dict[str, Any]:
+    def get_channel_stats(self) -> Dict[str, Any]:
         """
         Get channel statistics including subscriber and view counts.
         
-        Args:
-            max_retries: Maximum number of retry attempts
-            
+        Connection errors and 429/5xx responses are retried by the session
+        (see max_retries in __init__) before this method sees them.
+        
         Returns:
             Dictionary containing channel statistics
             
         Raises:
             APIError: If there is an error with the API request
+            RateLimitError: If the YouTube API quota is exceeded
         """
-        retries = 0
+        if self._cache and time.monotonic() - self._cache[0] < self.CACHE_TTL_SECONDS:
+            logger.info("Using cached YouTube channel statistics")
+            return dict(self._cache[1])
         
-        while retries <= max_retries:
-            try:
-                logger.info(f"Fetching YouTube channel statistics (attempt {retries + 1}/{max_retries + 1})")
-                
-                response = requests.get(self.endpoint, timeout=30)
-                
-                # Check for rate limiting
-                if response.status_code == 403 and "quotaExceeded" in response.text:
-                    error_msg = "YouTube API quota exceeded"
-                    logger.error(error_msg)
-                    
-                    if retries == max_retries:
-                        raise RateLimitError(error_msg, status_code=403, response=response.text)
-                        
-                    retries += 1
-                    # Wait before retrying (exponential backoff)
-                    time.sleep(2 ** retries)
-                    continue
-                
-                # Check for other API errors
-                if response.status_code != 200:
-                    error_msg = f"YouTube API returned error: {response.status_code} - {response.text}"
-                    logger.error(error_msg)
-                    
-                    if retries == max_retries:
-                        raise APIError(error_msg, status_code=response.status_code, response=response.text)
-                        
-                    retries += 1
-                    # Wait before retrying (exponential backoff)
-                    time.sleep(2 ** retries)
-                    continue
-                
-                # Parse the JSON response
-                data = response.json()
-                
-                # Extract statistics
-                if "items" in data and len(data["items"]) > 0:
-                    stats = data["items"][0]["statistics"]
-                    
-                    subscriber_count = int(stats.get("subscriberCount", 0))
-                    view_count = int(stats.get("viewCount", 0))
-                    
-                    logger.info(f"Successfully fetched YouTube stats: {subscriber_count} subscribers, {view_count} views")
-                    
-                    # Save to local file for backup/debugging
-                    self._save_stats_to_file(subscriber_count, view_count)
-                    
-                    return {
-                        "platform": "YouTube",
-                        "channel_id": self.channel_id,
-                        "subscribers": subscriber_count,
-                        "views": view_count,
-                        "timestamp": time.time()
-                    }
-                else:
-                    error_msg = "YouTube API response did not contain channel statistics"
-                    logger.error(error_msg)
-                    logger.debug(f"Response data: {data}")
-                    
-                    if retries == max_retries:
-                        return {
-                            "platform": "YouTube",
-                            "channel_id": self.channel_id,
-                            "subscribers": "Not Found",
-                            "views": "Not Found",
-                            "timestamp": time.time(),
-                            "error": error_msg
-                        }
-                        
-                    retries += 1
-                    # Wait before retrying (exponential backoff)
-                    time.sleep(2 ** retries)
-                
-            except (requests.RequestException, requests.Timeout) as e:
-                error_msg = f"Network error when fetching YouTube data: {str(e)}"
+        try:
+            logger.info("Fetching YouTube channel statistics")
+            
+            response = self.session.get(self.endpoint, timeout=30)
+            # One timestamp for the result, taken when the response arrived
+            fetched_at = time.time()
+            
+            # Check for rate limiting; the daily quota won't reset on a retry
+            if response.status_code == 403 and "quotaExceeded" in response.text:
+                error_msg = "YouTube API quota exceeded"
                 logger.error(error_msg)
+                raise RateLimitError(error_msg, status_code=403, response=response.text)
+            
+            # Check for other API errors
+            if response.status_code != 200:
+                error_msg = f"YouTube API returned error: {response.status_code} - {response.text}"
+                logger.error(error_msg)
+                raise APIError(error_msg, status_code=response.status_code, response=response.text)
+            
+            # Parse the JSON response
+            data = json_loads(response.content)
+            
+            # Extract statistics
+            if "items" in data and len(data["items"]) > 0:
+                stats = data["items"][0]["statistics"]
                 
-                if retries == max_retries:
-                    return {
-                        "platform": "YouTube",
-                        "channel_id": self.channel_id,
-                        "subscribers": "Not Found",
-                        "views": "Not Found",
-                        "timestamp": time.time(),
-                        "error": error_msg
-                    }
-                    
-                retries += 1
-                # Wait before retrying (exponential backoff)
-                time.sleep(2 ** retries)
+                subscriber_count = int(stats.get("subscriberCount", 0))
+                view_count = int(stats.get("viewCount", 0))
                 
-            except Exception as e:
-                error_msg = f"Unexpected error fetching YouTube data: {str(e)}"
-                logger.error(error_msg)
+                logger.info(f"Successfully fetched YouTube stats: {subscriber_count} subscribers, {view_count} views")
+                
+                # Save to local file for backup/debugging, off the request path
+                threading.Thread(
+                    target=self._save_stats_to_file,
+                    args=(subscriber_count, view_count),
+                    daemon=True
+                ).start()
                 
-                if retries == max_retries:
-                    return {
-                        "platform": "YouTube",
-                        "channel_id": self.channel_id,
-                        "subscribers": "Not Found",
-                        "views": "Not Found",
-                        "timestamp": time.time(),
-                        "error": error_msg
-                    }
-                    
-                retries += 1
-                # Wait before retrying (exponential backoff)
-                time.sleep(2 ** retries)
+                result = {
+                    "platform": "YouTube",
+                    "channel_id": self.channel_id,
+                    "subscribers": subscriber_count,
+                    "views": view_count,
+                    "timestamp": fetched_at
+                }
+                self._cache = (time.monotonic(), result)
+                return dict(result)
+            
+            # A successful response without the channel (e.g. a wrong ID)
+            # won't change on a retry
+            error_msg = "YouTube API response did not contain channel statistics"
+            logger.error(error_msg)
+            logger.debug("Response data: %s", data)
+            
+            return self._not_found(error_msg, timestamp=fetched_at)
+            
+        except (APIError, RateLimitError):
+            raise
+            
+        except requests.RequestException as e:
+            error_msg = f"Network error when fetching YouTube data: {str(e)}"
+            logger.error(error_msg)
+            
+            return self._not_found(error_msg)
+            
+        except Exception as e:
+            error_msg = f"Unexpected error fetching YouTube data: {str(e)}"
+            logger.error(error_msg)
+            
+            return self._not_found(error_msg)
+    
+    def _not_found(self, error_msg: str, timestamp: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Build the placeholder statistics returned when a lookup fails.
         
-        # This should never be reached due to the return statements above
+        Args:
+            error_msg: Description of the failure
+            timestamp: When the failed response arrived. If None, the current time.
+            
+        Returns:
+            Dictionary with the subscriber and view counts set to "Not Found"
+        """
         return {
             "platform": "YouTube",
             "channel_id": self.channel_id,
             "subscribers": "Not Found",
             "views": "Not Found",
-            "timestamp": time.time(),
-            "error": "Maximum retries reached"
+            "timestamp": timestamp if timestamp is not None else time.time(),
+            "error": error_msg
         }
     
     def _save_stats_to_file(self, subscribers: int, views: int) -> None:
         """
         Save statistics to a local file for backup/debugging.
         
+        Runs on a background thread; the file is best effort, so a write still
+        pending when the process exits is dropped. The stats are written to a
+        temporary file that then replaces STATS_FILE, so a write cut short
+        leaves the previous backup intact rather than a truncated one.
+        
         Args:
             subscribers: Number of subscribers
             views: Number of views
         """
+        content = f"{subscribers}\n{views}\n{time.strftime('%Y-%m-%d %H:%M:%S')}\n"
+        
+        temp_file = f"{STATS_FILE}.tmp"
         try:
-            with open("data/youtube_stats.txt", "w") as file:
-                file.write(f"{subscribers}\n")
-                file.write(f"{views}\n")
-                file.write(f"{time.strftime('%Y-%m-%d %H:%M:%S')}\n")
+            with _stats_file_lock:
+                with open(temp_file, "w") as file:
+                    file.write(content)
+                os.replace(temp_file, STATS_FILE)
                 
             logger.debug("Saved YouTube stats to file")
         except Exception as e:
@@ -1,23 +1,18 @@
 """
-Test for Instagram Direct Scraping.
+Test for Instagram Follower Extraction.
 
-This script specifically tests the direct scraping fallback mechanism
-of the InstagramService, bypassing the third-party API.
+This script tests the InstagramService's two sources, Instagram's web
+profile endpoint and the Socialblade scraping fallback, against canned
+responses, so it runs offline and in milliseconds.
 """
 
-import sys
-import os
 import time
 import logging
 from datetime import datetime
 import unittest
 from unittest.mock import patch, MagicMock
 
-# Add the project root directory to the Python path
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
-
 from services.instagram import InstagramService
-from utils.exceptions import ScrapingError
 
 # Configure logging
 logging.basicConfig(
@@ -31,95 +26,104 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+USERNAME = "nicolasboucherfinance"
+
+# Instagram web profile endpoint response
+WEB_PROFILE_FIXTURE = b'{"data": {"user": {"edge_followed_by": {"count": 123456}}}, "status": "ok"}'
+
+# Socialblade search pages -> follower count they hold. The count comes back
+# as an int on some routes and a comma-separated string on others, and the
+# platformResult sits at varying depths of the tRPC payload.
+SOCIALBLADE_FIXTURES = (
+    ('<html><head></head><body><script id="__NEXT_DATA__" type="application/json">'
+     '{"props": {"pageProps": {"platformResult": {"followers": 654321}}}}'
+     '</script></body></html>', 654321),
+    ('<html><body><script id="__NEXT_DATA__" type="application/json">'
+     '{"props": {"pageProps": {"trpcState": {"queries": [{"state": {"data": '
+     '{"platformResult": {"followers": "1,234,567"}}}}]}}}}'
+     '</script></body></html>', 1234567),
+)
+
+
 class TestInstagramScraping(unittest.TestCase):
-    """Test case for Instagram direct scraping functionality."""
-    
+    """Test case for Instagram follower extraction."""
+
     def setUp(self):
         """Set up test case with an Instagram service instance."""
-        self.service = InstagramService()
-    
-    @patch('services.instagram.InstagramService._get_followers_from_api')
-    def test_direct_scraping(self, mock_api):
+        self.service = InstagramService(username=USERNAME)
+
+    @patch('services.instagram.requests.Session.get')
+    def test_web_profile_endpoint(self, mock_get):
         """
-        Test the direct scraping functionality by forcing API failure.
-        
-        This test patches the API method to always fail, forcing the service
-        to use the direct scraping method instead.
+        Test that a web profile endpoint answer is used without a browser.
         """
-        # Mock the API method to always fail
-        mock_api.return_value = {
-            "success": False,
-            "error": "Forced API failure for testing"
-        }
-        
-        logger.info("Starting Instagram direct scraping test")
+        mock_get.return_value = MagicMock(status_code=200, content=WEB_PROFILE_FIXTURE)
+
+        logger.info("Starting Instagram web profile endpoint test")
         start_time = time.time()
-        
-        # Get follower data, which should now use scraping
-        data = self.service.get_followers()
-        
-        # Log the result
-        if data.get("followers") != "Not Found" and data.get("followers") is not None:
-            success = True
-            followers_count = data.get("followers")
-            source = data.get("source", "unknown")
-            
-            logger.info(f"Successfully retrieved {followers_count} followers via {source}")
-            status = f"SUCCESS via {source}"
-            
-            # Verify the data was retrieved via scraping
-            self.assertEqual(source, "direct-scraping", "Data should be retrieved via direct scraping")
-            self.assertIsInstance(followers_count, int, "Follower count should be an integer")
-            self.assertGreater(followers_count, 0, "Follower count should be greater than 0")
-        else:
-            success = False
-            error = data.get("error", "Unknown error")
-            
-            logger.error(f"Failed to retrieve follower count: {error}")
-            status = f"FAILURE: {error}"
-            
-            # If scraping failed, this test will fail
-            self.fail(f"Direct scraping failed: {error}")
-        
-        # Calculate execution time
+
+        with patch.object(InstagramService, '_fetch_profile') as mock_fetch_profile:
+            data = self.service.get_followers()
+
+        self.assertEqual(data["followers"], 123456)
+        self.assertEqual(data["source"], "instagram_web_profile")
+        mock_fetch_profile.assert_not_called()
+
         execution_time = time.time() - start_time
-        logger.info(f"Test completed in {execution_time:.2f} seconds: {status}")
-        
-        return success, followers_count, source
-    
-    def test_scraping_method_directly(self):
+        logger.info(f"Test completed in {execution_time:.2f} seconds")
+
+    @patch('services.instagram.requests.Session.get')
+    def test_direct_scraping(self, mock_get):
         """
-        Test the _get_followers_from_scraping method directly.
-        
-        This calls the internal scraping method directly to verify it works.
+        Test the Socialblade scraping fallback by forcing the endpoint to fail.
+
+        The endpoint is rate limited, so the handle is left for Socialblade;
+        each canned search page must yield its follower count.
         """
-        logger.info("Testing the scraping method directly")
+        mock_get.return_value = MagicMock(status_code=429, content=b'')
+
+        logger.info("Starting Instagram direct scraping test")
         start_time = time.time()
-        
-        # Call the scraping method directly
-        result = self.service._get_followers_from_scraping()
-        
-        if result["success"]:
-            logger.info(f"Scraping successful with {result['followers']} followers")
-            self.assertIsInstance(result["followers"], int, "Follower count should be an integer")
-            self.assertGreater(result["followers"], 0, "Follower count should be greater than 0")
-        else:
-            logger.error(f"Direct scraping method failed: {result.get('error')}")
-            self.fail(f"Scraping method failed: {result.get('error')}")
-        
+
+        self.assertEqual(self.service._fetch_web_profiles([USERNAME]), {})
+
+        for html, expected in SOCIALBLADE_FIXTURES:
+            with self.subTest(expected=expected):
+                with patch.object(InstagramService, '_fetch_html', return_value=(html, 200)):
+                    result = self.service._fetch_profile(None, USERNAME)
+
+                self.assertEqual(result["followers"], expected)
+                self.assertEqual(result["source"], "socialblade_live")
+
         execution_time = time.time() - start_time
-        logger.info(f"Direct scraping method test completed in {execution_time:.2f} seconds")
-        
-        return result["success"], result.get("followers")
+        logger.info(f"Test completed in {execution_time:.2f} seconds")
+
+    def test_scraping_method_directly(self):
+        """
+        Test the __NEXT_DATA__ parsing the scraper relies on.
+        """
+        logger.info("Testing the scraping parser directly")
+
+        for html, expected in SOCIALBLADE_FIXTURES:
+            with self.subTest(expected=expected):
+                data = self.service._extract_next_data(html)
+                platform_result = self.service._find_platform_result(data)
+
+                self.assertIsNotNone(platform_result, "Payload should hold a platformResult")
+                self.assertEqual(int(str(platform_result["followers"]).replace(",", "")), expected)
+
+        with self.assertRaises(RuntimeError):
+            self.service._extract_next_data("<html><body>Just a moment...</body></html>")
 
 def run_tests():
     """Run the Instagram scraping tests."""
     test_suite = unittest.TestSuite()
+    test_suite.addTest(TestInstagramScraping('test_web_profile_endpoint'))
     test_suite.addTest(TestInstagramScraping('test_direct_scraping'))
     test_suite.addTest(TestInstagramScraping('test_scraping_method_directly'))
-    
+
     runner = unittest.TextTestRunner(verbosity=2)
     return runner.run(test_suite)
 
 if __name__ == "__main__":
-    run_tests()
\ No newline at end of file
+    run_tests()
@@ -5,41 +5,47 @@ This script tests the LinkedInCompanyService by running it on all company pages
 and tracking success and failure rates.
 """
 
-import sys
-import os
 import time
 import logging
+from logging.handlers import RotatingFileHandler
+import argparse
 from datetime import datetime
 
-# Add the project root directory to the Python path
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
-
 from services.linkedin_company import LinkedInCompanyService
 from utils.exceptions import ScrapingError
 
+# Log file size cap and rotated copies kept, so long runs can't fill the disk
+LOG_MAX_BYTES = 5 * 1024 * 1024
+LOG_BACKUP_COUNT = 3
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
     handlers=[
-        logging.FileHandler(f"linkedin_company_test_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"),
+        RotatingFileHandler(
+            f"linkedin_company_test_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log",
+            maxBytes=LOG_MAX_BYTES,
+            backupCount=LOG_BACKUP_COUNT
+        ),
         logging.StreamHandler()
     ]
 )
 
 logger = logging.getLogger(__name__)
 
-def test_linkedin_company_service(iterations=1):
+def test_linkedin_company_service(iterations=1, workers=2):
     """
     Test the LinkedIn Company Service multiple times.
     
     Args:
         iterations: Number of times to run the complete test
+        workers: Number of browsers the service spreads the company pages over
         
     Returns:
         A tuple containing (total_companies, success_count, failure_count, success_rate)
     """
-    service = LinkedInCompanyService()
+    service = LinkedInCompanyService(max_browsers=workers)
     
     # Track total success and failure across all iterations
     total_companies = len(service.company_urls) * iterations
@@ -48,7 +54,7 @@ def test_linkedin_company_service(iterations=1):
     all_results = []
     
     logger.info(f"Starting LinkedIn Company Service test with {iterations} iterations")
-    logger.info(f"Testing {len(service.company_urls)} company pages per iteration")
+    logger.info(f"Testing {len(service.company_urls)} company pages per iteration on {service.max_browsers} browsers")
     
     start_time = time.time()
     
@@ -109,5 +115,10 @@ def test_linkedin_company_service(iterations=1):
     return total_companies, total_success, total_failure, success_rate
 
 if __name__ == "__main__":
-    # Run the test once to check all company pages
-    test_linkedin_company_service(1)
\ No newline at end of file
+    parser = argparse.ArgumentParser(description='Test the LinkedIn Company Service')
+    parser.add_argument('--iterations', type=int, default=1, help='Number of times to run the complete test')
+    parser.add_argument('--workers', type=int, default=2, help='Number of browsers to fetch the pages with')
+    args = parser.parse_args()
+    
+    # By default, run the test once to check all company pages
+    test_linkedin_company_service(args.iterations, args.workers)
\ No newline at end of file
@@ -5,30 +5,37 @@ This script tests the LinkedInProfileService by running it 50 times sequentially
 and tracking success and failure rates.
 """
 
-import sys
-import os
 import time
 import logging
+from logging.handlers import RotatingFileHandler
 from datetime import datetime
 
-# Add the project root directory to the Python path
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
-
 from services.linkedin_profile import LinkedInProfileService
 from utils.exceptions import ScrapingError
 
+# Log file size cap and rotated copies kept, so long runs can't fill the disk
+LOG_MAX_BYTES = 5 * 1024 * 1024
+LOG_BACKUP_COUNT = 3
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
     handlers=[
-        logging.FileHandler(f"linkedin_profile_test_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"),
+        RotatingFileHandler(
+            f"linkedin_profile_test_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log",
+            maxBytes=LOG_MAX_BYTES,
+            backupCount=LOG_BACKUP_COUNT
+        ),
         logging.StreamHandler()
     ]
 )
 
 logger = logging.getLogger(__name__)
 
+# Start iterations at most this often (seconds) to prevent rate limiting
+MIN_ITERATION_INTERVAL = 1.0
+
 def test_linkedin_profile_service(iterations=50):
     """
     Test the LinkedIn Profile Service multiple times.
@@ -78,8 +85,11 @@ def test_linkedin_profile_service(iterations=50):
         iteration_time = time.time() - iteration_start
         logger.info(f"Iteration {i} completed in {iteration_time:.2f} seconds: {status}")
         
-        # Small delay to prevent rate limiting
-        time.sleep(1)
+        # Only wait out what is left of the interval; a scrape takes longer
+        # than that, so normally the next iteration starts right away
+        remaining = MIN_ITERATION_INTERVAL - (time.time() - iteration_start)
+        if remaining > 0 and i < iterations:
+            time.sleep(remaining)
     
     # Calculate statistics
     total_time = time.time() - start_time
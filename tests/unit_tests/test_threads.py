@@ -0,0 +1,62 @@
+"""
+Test for Threads Follower Extraction.
+
+This script tests ThreadsProfileService's regex extraction against canned
+page fragments, so it runs offline and in milliseconds.
+"""
+
+import logging
+import unittest
+
+from services.threads import ThreadsProfileService
+
+logger = logging.getLogger(__name__)
+
+# Rendered-text fragments -> follower count they hold. Only the text fallback
+# matches these, so the scan must start far enough before the "followers"
+# marker to take in the digits, whatever whitespace separates them.
+TEXT_FIXTURES = (
+    ('<span>2,133 followers</span>', 2133),
+    ('<span>2,133\n' + ' ' * 40 + 'followers</span>', 2133),
+    ('<span>2,133\xa0followers</span>', 2133),
+    ('<span>2,133\u202ffollowers</span>', 2133),
+)
+
+class TestThreadsExtraction(unittest.TestCase):
+    """Test cases for Threads follower extraction."""
+
+    def setUp(self):
+        """Set up the test environment."""
+        self.service = ThreadsProfileService()
+
+    def test_json_patterns(self):
+        """
+        Test the embedded JSON patterns, preferred over the rendered text.
+        """
+        html = '<span>9 followers</span><script>{"follower_count": 2133}</script>'
+        self.assertEqual(self.service._extract_followers(html), 2133)
+
+        html = '<script>{"followerCount":2133}</script>'
+        self.assertEqual(self.service._extract_followers(html), 2133)
+
+    def test_text_fallback(self):
+        """
+        Test the rendered-text fallback across the whitespace it allows.
+        """
+        for html, expected in TEXT_FIXTURES:
+            with self.subTest(html=html):
+                self.assertEqual(self.service._extract_followers(html), expected)
+
+        self.assertIsNone(self.service._extract_followers("<html><body>Log in</body></html>"))
+
+def run_tests():
+    """Run the Threads extraction tests."""
+    test_suite = unittest.TestSuite()
+    test_suite.addTest(TestThreadsExtraction('test_json_patterns'))
+    test_suite.addTest(TestThreadsExtraction('test_text_fallback'))
+
+    runner = unittest.TextTestRunner(verbosity=2)
+    return runner.run(test_suite)
+
+if __name__ == "__main__":
+    run_tests()
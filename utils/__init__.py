@@ -4,34 +4,49 @@ Utility modules for the followers tracker application.
 This package contains utility modules that provide helper functionality
 for the application, including browser automation, data submission,
 logging, and error handling.
+
+The names listed in ``__all__`` are imported from their submodule on first
+access, so importing one utility (e.g. ``utils.exceptions``) does not load
+the others, Playwright included.
 """
 
-from utils.playwright_driver import PlaywrightDriver
-from utils.forms_submitter import GoogleFormsSubmitter
-from utils.logger import setup_logger
-from utils.exceptions import (
-    FollowersTrackerError,
-    AuthenticationError,
-    ScrapingError,
-    APIError,
-    ConfigurationError,
-    DataSubmissionError,
-    DatabaseError,
-    ValidationError,
-    RateLimitError
-)
-
-__all__ = [
-    'PlaywrightDriver',
-    'GoogleFormsSubmitter',
-    'setup_logger',
-    'FollowersTrackerError',
-    'AuthenticationError',
-    'ScrapingError',
-    'APIError',
-    'ConfigurationError',
-    'DataSubmissionError',
-    'DatabaseError',
-    'ValidationError',
-    'RateLimitError'
-]
\ No newline at end of file
+import importlib
+
+
+# Public name -> submodule that defines it
+_EXPORTS = {
+    'PlaywrightDriver': 'utils.playwright_driver',
+    'GoogleFormsSubmitter': 'utils.forms_submitter',
+    'json_loads': 'utils.json_utils',
+    'setup_logger': 'utils.logger',
+    'FollowersTrackerError': 'utils.exceptions',
+    'AuthenticationError': 'utils.exceptions',
+    'ScrapingError': 'utils.exceptions',
+    'APIError': 'utils.exceptions',
+    'ConfigurationError': 'utils.exceptions',
+    'DataSubmissionError': 'utils.exceptions',
+    'DatabaseError': 'utils.exceptions',
+    'ValidationError': 'utils.exceptions',
+    'RateLimitError': 'utils.exceptions'
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    """
+    Import the re-exported names from their submodule (PEP 562).
+
+    The value is stored in the package namespace, so each name is only
+    resolved once; later reads are plain attribute lookups.
+    """
+    if name in _EXPORTS:
+        module = importlib.import_module(_EXPORTS[name])
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -7,7 +7,10 @@ submitting it to Google Forms.
 
 import logging
 import time
-from typing import Dict, Any, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple
+
+import requests
 
 from config.settings import (
     FOLLOWERS_FORM_URL,
@@ -20,6 +23,77 @@ from utils.exceptions import DataSubmissionError
 
 logger = logging.getLogger(__name__)
 
+
+def _company_source(name: Any) -> str:
+    """
+    Source key of a LinkedIn company page, normalized so that casing or
+    stray whitespace in the scraped name ("Ai Finance Club ") still matches.
+    """
+    return f"company:{str(name).strip().casefold()}"
+
+
+# Followers form field -> (source, key in the source's data, default when
+# missing). Sources are the submit_followers_data arguments; a LinkedIn
+# company page is addressed by _company_source(<name>).
+FOLLOWERS_FORM_SPEC = (
+    # LinkedIn Profile Data
+    ('Nicolas Boucher Personal Account', 'linkedin_profile', 'followers', None),
+
+    # LinkedIn Company Data
+    ('Business Infographics', _company_source('Business Infographics'), 'followers', None),
+    ('Nicolas Boucher Online', _company_source('Nicolas Boucher Online'), 'followers', None),
+    ('AI Finance Club', _company_source('AI Finance Club'), 'followers', None),
+    ('Excel Cheatsheets', _company_source('Excel Cheatsheets'), 'followers', None),
+
+    # LinkedIn Newsletter Data
+    ('AI + Finance by Nicolas Boucher Newsteller', 'linkedin_newsletter', 'subscribers', None),
+
+    # YouTube Data
+    ('Nicolas Boucher Online Videos | YouTube Subscribers', 'youtube', 'subscribers', None),
+    ('Nicolas Boucher Online Videos | YouTube Total Views', 'youtube', 'views', None),
+
+    # Instagram Data
+    ('Instagram Total Followers', 'instagram', 'followers', None),
+    ('AI Finance Club Instagram Followers', 'instagram_aifc', 'followers', None),
+
+    # Facebook Data
+    ('Facebook Page Total Followers', 'facebook', 'followers', None),
+
+    # Twitter Data
+    ('X Total Number of Followers', 'twitter', 'followers', None),
+    ('X Followers Last 30 Days', 'twitter', 'followers_last_30_days', 'Not Available'),
+    ('X Followers Last 30 Days Percentage', 'twitter', 'followers_percentage', 'Not Available'),
+
+    # Kit Data
+    ("Kit's Daily Number of Subscribers", 'kit', 'subscribers', None),
+
+    # Tiktok Data
+    ('Tiktok Followers', 'tiktok', 'followers', None),
+    ('Tiktok Likes', 'tiktok', 'likes', None),
+
+    ('Threads Followers', 'threads', 'followers', None),
+)
+
+# Kit stats form field -> (period, key in that period's stats). The labels are
+# irregular ("Cancellation" vs "Weekly Cancellations"), so they are listed as
+# the form spells them.
+KIT_STATS_FORM_SPEC = (
+    ("Today's Number of Subs", 'daily', 'subscribers'),
+    ('Cancellation', 'daily', 'cancellations'),
+    ('Net New Subscribers', 'daily', 'net_new_subscribers'),
+    ('New Subscribers', 'daily', 'new_subscribers'),
+
+    ('Weekly Number of Subscribers', 'weekly', 'subscribers'),
+    ('Weekly Cancellations', 'weekly', 'cancellations'),
+    ('Weekly Net New Subscribers', 'weekly', 'net_new_subscribers'),
+    ('Weekly New Subscribers', 'weekly', 'new_subscribers'),
+
+    ('Monthly Number of Subs', 'monthly', 'subscribers'),
+    ('Monthly Cancellations', 'monthly', 'cancellations'),
+    ('Monthly Net New Subscribers', 'monthly', 'net_new_subscribers'),
+    ('Monthly New Subscribers', 'monthly', 'new_subscribers'),
+)
+
 class FollowersSubmitter:
     """
     Utility for collecting follower data and submitting it to Google Forms.
@@ -28,16 +102,27 @@ class FollowersSubmitter:
     and submitting the data to the configured Google Forms.
     """
 
-    def __init__(self):
-        """Initialize the FollowersSubmitter."""
+    def __init__(self, session: Optional[requests.Session] = None):
+        """
+        Initialize the FollowersSubmitter.
+
+        Args:
+            session: Optional session shared by both form submitters. If None,
+                     one is created for the two of them, so both submissions
+                     and their retries draw on one connection pool.
+        """
+        session = session or requests.Session()
+
         self.followers_form_submitter = GoogleFormsSubmitter(
             FOLLOWERS_FORM_URL,
-            FOLLOWERS_FORM_FIELDS
+            FOLLOWERS_FORM_FIELDS,
+            session=session
         )
 
         self.kit_stats_form_submitter = GoogleFormsSubmitter(
             KIT_STATS_FORM_URL,
-            KIT_STATS_FORM_FIELDS
+            KIT_STATS_FORM_FIELDS,
+            session=session
         )
 
         logger.info("FollowersSubmitter initialized")
@@ -54,7 +139,7 @@ class FollowersSubmitter:
                             tiktok_data,
                             threads_data: Dict[str, Any],
                             kit_data: Dict[str, Any],
-                            ) -> bool:
+                            ) -> Optional[bool]:
         """
         Submit followers data to the followers form.
 
@@ -72,72 +157,45 @@ class FollowersSubmitter:
             kit_data: Data from Kit service daily stats
 
         Returns:
-            True if submission was successful, False otherwise
+            True if submission was successful, False if it failed, or None if
+            it was skipped because no field held any data
 
         Raises:
             DataSubmissionError: If there is an error mapping or submitting the data
         """
         try:
-            # Map company data by name
-            company_data_by_name = {}
-            for company in linkedin_company_data:
-                company_data_by_name[company.get("name")] = company
-
-            # Guard against services that returned None entirely
-            instagram_data = instagram_data or {}
-            instagram_aifc_data = instagram_aifc_data or {}
-            tiktok_data = tiktok_data or {}
-            threads_data = threads_data or {}
+            # Every source by name; services that returned None count as empty
+            sources = {_company_source(company.get('name')): company for company in linkedin_company_data}
+            sources.update(
+                linkedin_profile=linkedin_profile_data,
+                linkedin_newsletter=linkedin_newsletter_data,
+                youtube=youtube_data,
+                instagram=instagram_data,
+                instagram_aifc=instagram_aifc_data,
+                facebook=facebook_data,
+                twitter=twitter_data,
+                kit=kit_data,
+                tiktok=tiktok_data,
+                threads=threads_data
+            )
 
             # Map all data to form fields
             form_data = {
-                # LinkedIn Profile Data
-                'Nicolas Boucher Personal Account': linkedin_profile_data.get("followers"),
-
-                # LinkedIn Company Data
-                'Business Infographics': company_data_by_name.get("Business Infographics", {}).get("followers"),
-                'Nicolas Boucher Online': company_data_by_name.get("Nicolas Boucher Online", {}).get("followers"),
-                'AI Finance Club': company_data_by_name.get("AI Finance Club", {}).get("followers"),
-                'Excel Cheatsheets': company_data_by_name.get("Excel Cheatsheets", {}).get("followers"),
-
-                # LinkedIn Newsletter Data
-                'AI + Finance by Nicolas Boucher Newsteller': linkedin_newsletter_data.get("subscribers"),
-
-                # YouTube Data
-                'Nicolas Boucher Online Videos | YouTube Subscribers': youtube_data.get("subscribers"),
-                'Nicolas Boucher Online Videos | YouTube Total Views': youtube_data.get("views"),
-
-                # Instagram Data
-                'Instagram Total Followers': instagram_data.get("followers"),
-                'AI Finance Club Instagram Followers': instagram_aifc_data.get("followers"),  # NEW
-
-                # Facebook Data
-                'Facebook Page Total Followers': facebook_data.get("followers"),
-
-                # Twitter Data
-                'X Total Number of Followers': twitter_data.get("followers"),
-                'X Followers Last 30 Days': twitter_data.get("followers_last_30_days", "Not Available"),
-                'X Followers Last 30 Days Percentage': twitter_data.get("followers_percentage", "Not Available"),
-
-                # Kit Data
-                "Kit's Daily Number of Subscribers": kit_data.get("subscribers"),
-
-                # Tiktok Data
-                "Tiktok Followers": tiktok_data.get("followers"),
-                "Tiktok Likes": tiktok_data.get("likes"),
-
-                "Threads Followers": threads_data.get("followers"),
+                field: (sources.get(source) or {}).get(key, default)
+                for field, source, key, default in FOLLOWERS_FORM_SPEC
             }
 
             # Log the mapped data
             logger.info("Mapped followers data for form submission")
-            logger.debug(f"Form data: {form_data}")
+            logger.debug("Form data: %s", form_data)
 
             # Submit the data
             success = self.followers_form_submitter.submit_data(form_data)
 
             if success:
                 logger.info("Successfully submitted followers data to Google Form")
+            elif success is None:
+                logger.warning("No followers data to submit; skipped the Google Form")
             else:
                 logger.error("Failed to submit followers data to Google Form")
 
@@ -150,7 +208,7 @@ class FollowersSubmitter:
 
     def submit_kit_stats(self, kit_daily: Dict[str, Any],
                          kit_weekly: Dict[str, Any],
-                         kit_monthly: Dict[str, Any]) -> bool:
+                         kit_monthly: Dict[str, Any]) -> Optional[bool]:
         """
         Submit Kit statistics to the Kit stats form.
 
@@ -160,39 +218,31 @@ class FollowersSubmitter:
             kit_monthly: Monthly Kit stats
 
         Returns:
-            True if submission was successful, False otherwise
+            True if submission was successful, False if it failed, or None if
+            it was skipped because no field held any data
 
         Raises:
             DataSubmissionError: If there is an error mapping or submitting the data
         """
         try:
             # Map Kit stats to form fields
+            periods = {"daily": kit_daily, "weekly": kit_weekly, "monthly": kit_monthly}
             form_data = {
-                "Today's Number of Subs": kit_daily.get("subscribers"),
-                "Cancellation": kit_daily.get("cancellations"),
-                "Net New Subscribers": kit_daily.get("net_new_subscribers"),
-                "New Subscribers": kit_daily.get("new_subscribers"),
-
-                "Weekly Number of Subscribers": kit_weekly.get("subscribers"),
-                "Weekly Cancellations": kit_weekly.get("cancellations"),
-                "Weekly Net New Subscribers": kit_weekly.get("net_new_subscribers"),
-                "Weekly New Subscribers": kit_weekly.get("new_subscribers"),
-
-                "Monthly Number of Subs": kit_monthly.get("subscribers"),
-                "Monthly Cancellations": kit_monthly.get("cancellations"),
-                "Monthly Net New Subscribers": kit_monthly.get("net_new_subscribers"),
-                "Monthly New Subscribers": kit_monthly.get("new_subscribers")
+                field: periods[period].get(key)
+                for field, period, key in KIT_STATS_FORM_SPEC
             }
 
             # Log the mapped data
             logger.info("Mapped Kit stats data for form submission")
-            logger.debug(f"Form data: {form_data}")
+            logger.debug("Form data: %s", form_data)
 
             # Submit the data
             success = self.kit_stats_form_submitter.submit_data(form_data)
 
             if success:
                 logger.info("Successfully submitted Kit stats to Google Form")
+            elif success is None:
+                logger.warning("No Kit stats to submit; skipped the Google Form")
             else:
                 logger.error("Failed to submit Kit stats to Google Form")
 
@@ -201,4 +251,66 @@ class FollowersSubmitter:
         except Exception as e:
             error_msg = f"Error submitting Kit stats: {str(e)}"
             logger.error(error_msg)
-            raise DataSubmissionError(error_msg)
\ No newline at end of file
+            raise DataSubmissionError(error_msg)
+
+    def submit_all(self,
+                   linkedin_profile_data: Dict[str, Any],
+                   linkedin_company_data: List[Dict[str, Any]],
+                   linkedin_newsletter_data: Dict[str, Any],
+                   youtube_data: Dict[str, Any],
+                   instagram_data: Dict[str, Any],
+                   instagram_aifc_data: Dict[str, Any],
+                   facebook_data: Dict[str, Any],
+                   twitter_data: Dict[str, Any],
+                   tiktok_data,
+                   threads_data: Dict[str, Any],
+                   kit_data: Dict[str, Dict[str, Any]],
+                   ) -> Tuple[Optional[bool], Optional[bool]]:
+        """
+        Submit the followers form and the Kit stats form concurrently.
+
+        The two forms are independent POSTs, so they are sent at the same time
+        rather than one after the other.
+
+        Args:
+            linkedin_profile_data: Data from LinkedIn profile service
+            linkedin_company_data: Data from LinkedIn company service
+            linkedin_newsletter_data: Data from LinkedIn newsletter service
+            youtube_data: Data from YouTube service
+            instagram_data: Data for the personal Instagram profile
+            instagram_aifc_data: Data for the AI Finance Club Instagram profile
+            facebook_data: Data from Facebook service
+            twitter_data: Data from Twitter service
+            tiktok_data: Data from TikTok service
+            threads_data: Data from Threads service
+            kit_data: Kit stats keyed by "daily", "weekly" and "monthly"
+
+        Returns:
+            Tuple of (followers form success, Kit stats form success), each
+            None if that form was skipped for lack of data
+
+        Raises:
+            DataSubmissionError: If there is an error mapping or submitting the data
+        """
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            followers_future = executor.submit(
+                self.submit_followers_data,
+                linkedin_profile_data,
+                linkedin_company_data,
+                linkedin_newsletter_data,
+                youtube_data,
+                instagram_data,
+                instagram_aifc_data,
+                facebook_data,
+                twitter_data,
+                tiktok_data,
+                threads_data,
+                kit_data["daily"]
+            )
+            kit_future = executor.submit(
+                self.submit_kit_stats,
+                kit_data["daily"],
+                kit_data["weekly"],
+                kit_data["monthly"]
+            )
+            return followers_future.result(), kit_future.result()
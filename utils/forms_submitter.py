@@ -1,10 +1,26 @@
 import requests
 import logging
-from typing import Dict, Any, Optional, Union
+import random
+from typing import Dict, Any, Mapping, Optional, Union
 import time
 
 logger = logging.getLogger(__name__)
 
+def _backoff(retries: int) -> None:
+    """
+    Sleep before retry number `retries`: exponential, with jitter so that
+    concurrent submitters don't retry in lockstep.
+    """
+    time.sleep((2 ** retries) * (0.5 + random.random() * 0.5))
+
+# Stands in for a missing key, so one dict.get tells absent from a None value
+_MISSING = object()
+
+# Values that stand for a failed scrape rather than data: missing values, the
+# services' failure marker, and the placeholder the followers form spec fills
+# in for fields with no source value
+NO_DATA_VALUES = (None, "Not Found", "Not Available")
+
 class GoogleFormsSubmitter:
     """
     A utility class to submit data to Google Forms.
@@ -12,20 +28,28 @@ class GoogleFormsSubmitter:
     This class handles mapping data fields to form fields and submitting the data.
     """
     
-    def __init__(self, form_url: str, form_fields: Dict[str, str], timeout: int = 30):
+    def __init__(self, form_url: str, form_fields: Mapping[str, str], timeout: int = 30,
+                 session: Optional[requests.Session] = None):
         """
         Initialize the GoogleFormsSubmitter.
         
         Args:
             form_url: The URL of the Google Form to submit data to.
-            form_fields: A dictionary mapping data keys to form field names.
+            form_fields: A mapping of data keys to form field names.
             timeout: Request timeout in seconds.
+            session: Optional session to send requests through, so several
+                     submitters can share one keep-alive connection. If None,
+                     the submitter creates its own, so retries reuse the
+                     connection of the first attempt.
         """
         self.form_url = form_url
+        self.session = session or requests.Session()
         self.form_fields = form_fields
+        # Snapshot of the field pairs, walked on every submission
+        self._field_items = tuple(form_fields.items())
         self.timeout = timeout
     
-    def submit_data(self, data: Dict[str, Any], max_retries: int = 3) -> bool:
+    def submit_data(self, data: Dict[str, Any], max_retries: int = 3) -> Optional[bool]:
         """
         Submit data to the Google Form.
         
@@ -34,23 +58,33 @@ class GoogleFormsSubmitter:
             max_retries: Maximum number of retry attempts for failed submissions.
             
         Returns:
-            True if submission was successful, False otherwise.
+            True if submission was successful, False if it failed, or None if
+            it was skipped because no field held any data.
         """
         # Map data to form fields
-        form_data = {self.form_fields[key]: value 
-                    for key, value in data.items() 
-                    if key in self.form_fields}
+        form_data = {}
+        for key, field in self._field_items:
+            value = data.get(key, _MISSING)
+            if value is not _MISSING:
+                form_data[field] = value
+        
+        # Nothing worth posting (no mapped field, or every scrape failed):
+        # don't spend a request (and its retries) on it
+        if all(value in NO_DATA_VALUES for value in form_data.values()):
+            logger.warning(f"No data for any form field; skipping submission to {self.form_url}")
+            return None
         
         # Log what's being submitted (without sensitive data)
         logger.info(f"Submitting data to Google Form: {self.form_url}")
-        logger.debug(f"Form fields being submitted: {list(form_data.keys())}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Form fields being submitted: %s", list(form_data))
         
         # Track retries
         retries = 0
         
         while retries <= max_retries:
             try:
-                response = requests.post(
+                response = self.session.post(
                     self.form_url, 
                     data=form_data,
                     timeout=self.timeout
@@ -61,12 +95,17 @@ class GoogleFormsSubmitter:
                     return True
                 else:
                     logger.warning(f"Failed to submit data. Status code: {response.status_code}")
+                    # A rejected submission (bad field, closed form) fails the
+                    # same way every time; only rate limits and server errors
+                    # are worth another attempt
+                    if 400 <= response.status_code < 500 and response.status_code != 429:
+                        logger.error("Submission rejected by Google Forms; not retrying.")
+                        return False
                     if retries == max_retries:
                         logger.error("Maximum retry attempts reached.")
                         return False
                     retries += 1
-                    # Exponential backoff
-                    time.sleep(2 ** retries)
+                    _backoff(retries)
                     logger.info(f"Retrying submission (attempt {retries}/{max_retries})...")
                     
             except requests.RequestException as e:
@@ -74,8 +113,7 @@ class GoogleFormsSubmitter:
                 if retries == max_retries:
                     return False
                 retries += 1
-                # Exponential backoff
-                time.sleep(2 ** retries)
+                _backoff(retries)
                 logger.info(f"Retrying submission (attempt {retries}/{max_retries})...")
         
         return False
\ No newline at end of file
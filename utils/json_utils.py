@@ -0,0 +1,36 @@
+"""
+JSON helpers.
+
+Parses with orjson when it is installed and falls back to the standard
+library otherwise, so orjson stays an optional speed-up.
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # optional: faster JSON parsing, stdlib json otherwise
+    orjson = None
+
+
+def json_loads(data: Union[bytes, str]) -> Any:
+    """
+    Parse a JSON document.
+    
+    Pass raw bytes (e.g. ``response.content``) where possible: orjson reads
+    them directly, skipping the bytes-to-str decode and charset detection
+    that ``response.text``/``response.json()`` go through.
+    
+    Args:
+        data: The JSON document as bytes or str.
+        
+    Returns:
+        The parsed value.
+        
+    Raises:
+        ValueError: If the document is not valid JSON.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -1,8 +1,15 @@
+import atexit
 import logging
 import os
+import queue
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from typing import Optional
 
+# Log file size cap and how many rotated files are kept
+LOG_MAX_BYTES = 10 * 1024 * 1024
+LOG_BACKUP_COUNT = 5
+
 def setup_logger(
     log_file: Optional[str] = None,
     log_level: int = logging.INFO,
@@ -13,6 +20,9 @@ def setup_logger(
     
     Args:
         log_file: Path to the log file. If None, logs will only be printed to console.
+                  The file is written from a background thread and rotated
+                  at LOG_MAX_BYTES; the listener doing the writing is kept
+                  on the logger as ``queue_listener``.
         log_level: The logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL).
         module_name: Name to use for the logger.
         
@@ -27,6 +37,13 @@ def setup_logger(
     for handler in logger.handlers[:]:
         logger.removeHandler(handler)
     
+    # Stop the file writer of a previous setup, flushing what it has queued
+    previous_listener = getattr(logger, "queue_listener", None)
+    if previous_listener is not None:
+        previous_listener.stop()
+        atexit.unregister(previous_listener.stop)
+        logger.queue_listener = None
+    
     # Define formatter
     formatter = logging.Formatter(
         '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
@@ -50,8 +67,20 @@ def setup_logger(
             filename, ext = os.path.splitext(log_file)
             log_file = f"{filename}_{datetime.now().strftime('%Y%m%d_%H%M%S')}{ext}"
             
-        file_handler = logging.FileHandler(log_file)
+        file_handler = RotatingFileHandler(
+            log_file,
+            maxBytes=LOG_MAX_BYTES,
+            backupCount=LOG_BACKUP_COUNT
+        )
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        
+        # Logging calls only enqueue the record; the listener's thread does
+        # the disk writes, and is stopped (draining the queue) at exit
+        log_queue = queue.Queue(-1)
+        listener = QueueListener(log_queue, file_handler)
+        listener.start()
+        atexit.register(listener.stop)
+        logger.queue_listener = listener
+        logger.addHandler(QueueHandler(log_queue))
     
     return logger
\ No newline at end of file
@@ -1,10 +1,186 @@
-from playwright.sync_api import sync_playwright, BrowserContext
-import json
+import os
+import random
 import logging
-from typing import Optional, Dict, Any
+import threading
+from typing import TYPE_CHECKING, Callable, Optional, Dict, Any, List, Tuple
+
+from utils.json_utils import json_loads
+
+if TYPE_CHECKING:
+    from playwright.sync_api import BrowserContext
 
 logger = logging.getLogger(__name__)
 
+# Resource types the scrapers never read; they only need the HTML and scripts.
+HEAVY_RESOURCE_TYPES = frozenset({"image", "media", "font", "stylesheet"})
+
+
+def abort_heavy_resources(route) -> None:
+    """
+    Route handler that aborts image, media, font and stylesheet requests.
+    
+    Register it with ``context.route("**/*", abort_heavy_resources)``.
+    """
+    if route.request.resource_type in HEAVY_RESOURCE_TYPES:
+        route.abort()
+    else:
+        route.continue_()
+
+
+# Runs a regex with named groups over the page's serialized DOM and returns the
+# text of the best-ranked group that matched (earliest in ``groups``), or null.
+# Call as ``page.evaluate(BEST_MATCH_IN_PAGE_JS, [source, groups])``; JavaScript
+# spells named groups (?<name>...) rather than Python's (?P<name>...). Only the
+# matched digits cross back to Python instead of the whole document.
+BEST_MATCH_IN_PAGE_JS = """([source, groups]) => {
+    const re = new RegExp(source, 'g');
+    const html = document.documentElement.outerHTML;
+    let bestRank = groups.length, best = null, m;
+    while ((m = re.exec(html)) !== null) {
+        for (let rank = 0; rank < bestRank; rank++) {
+            const text = m.groups[groups[rank]];
+            if (text !== undefined) { bestRank = rank; best = text; break; }
+        }
+        if (bestRank === 0) break;
+    }
+    return best;
+}"""
+
+# True once the regex ``source`` (JavaScript syntax) matches the live DOM
+PATTERN_RENDERED_JS = "(source) => new RegExp(source).test(document.documentElement.outerHTML)"
+
+# Longest the scrapers wait after navigation for a count to render
+PAGE_SETTLE_MS = 3000
+
+
+def wait_for_pattern(page, source: str, timeout: int = PAGE_SETTLE_MS) -> bool:
+    """
+    Wait until a regex matches the page's DOM.
+    
+    Args:
+        page: Playwright page to poll
+        source: JavaScript regex source, as passed to BEST_MATCH_IN_PAGE_JS
+        timeout: Longest to wait, in milliseconds
+        
+    Returns:
+        True if the pattern matched in time, False if the wait timed out
+    """
+    from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+    
+    try:
+        page.wait_for_function(PATTERN_RENDERED_JS, arg=source, timeout=timeout, polling=250)
+    except PlaywrightTimeoutError:
+        return False
+    return True
+
+
+def response_text(response) -> Optional[str]:
+    """
+    Read the document a navigation received, before the page parses it.
+    
+    Args:
+        response: Playwright response returned by page.goto, or None
+        
+    Returns:
+        The response body, or None if there was no successful response or
+        its body could not be read
+    """
+    if response is None or not response.ok:
+        return None
+    
+    try:
+        return response.text()
+    except Exception as e:
+        logger.debug(f"Could not read the document response: {e}")
+        return None
+
+
+# User agents new contexts are created with (see PlaywrightDriver._get_user_agent).
+# Default Chrome user agent
+DEFAULT_USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/123.0.0.0 Safari/537.36"
+
+# Collection of desktop user agents
+DESKTOP_USER_AGENTS = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/123.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.3 Safari/605.1.15",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36 Edg/121.0.0.0",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:109.0) Gecko/20100101 Firefox/115.0",
+    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36 OPR/108.0.0.0",
+)
+
+# Playwright device descriptor "mobile" contexts emulate, user agent
+# included. It ships with Chromium, the browser the driver launches, so the
+# user agent and the engine behind it agree.
+MOBILE_DEVICE = "Pixel 7"
+
+# User agent type -> the user agents one is picked from ("mobile" contexts
+# take theirs from MOBILE_DEVICE instead)
+USER_AGENTS_BY_TYPE = {
+    "default": (DEFAULT_USER_AGENT,),
+    "random": DESKTOP_USER_AGENTS,
+}
+
+
+# Parsed cookie files keyed by (absolute path, parser), with the
+# (mtime_ns, size) they were read at. Shared by every driver and service, so
+# a file is only re-parsed once it changes on disk.
+_cookie_cache: Dict[Tuple[str, Callable], Tuple[Tuple[int, int], List[Dict[str, Any]]]] = {}
+_cookie_cache_lock = threading.Lock()
+
+
+def load_cached_cookies(path, parse: Callable[[Any], List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    """
+    Return the cookies ``parse`` reads from a file, parsing it only when it changed.
+    
+    Args:
+        path: Path to the cookies file (str or Path)
+        parse: Function turning the path into a list of cookie dicts
+        
+    Returns:
+        A fresh copy of the cookie list, safe for the caller to modify
+        
+    Raises:
+        FileNotFoundError: If the file does not exist
+    """
+    st = os.stat(path)
+    signature = (st.st_mtime_ns, st.st_size)
+    key = (os.path.abspath(path), parse)
+    
+    with _cookie_cache_lock:
+        cached = _cookie_cache.get(key)
+        if cached is None or cached[0] != signature:
+            cached = (signature, parse(path))
+            _cookie_cache[key] = cached
+    
+    return [dict(cookie) for cookie in cached[1]]
+
+
+def _read_cookie_json(path) -> List[Dict[str, Any]]:
+    """Read a Playwright cookie list from a JSON file."""
+    # Read as bytes: orjson parses them directly when installed
+    with open(path, 'rb') as file:
+        return json_loads(file.read())
+
+
+def _load_cookies(path: str) -> List[Dict[str, Any]]:
+    """
+    Return the cookies stored in a JSON file, parsing it only when it changed.
+    
+    Args:
+        path: Path to the cookies file
+        
+    Returns:
+        A fresh copy of the cookie list, safe for the caller to modify
+        
+    Raises:
+        FileNotFoundError: If the file does not exist
+        ValueError: If the file is not valid JSON
+    """
+    return load_cached_cookies(path, _read_cookie_json)
+
+
 class PlaywrightDriver:
     """
     A utility class to manage Playwright browser automation.
@@ -12,25 +188,32 @@ class PlaywrightDriver:
     This class handles browser initialization, cookie management, and cleanup.
     """
     
-    def __init__(self, cookies_file: Optional[str] = None):
+    def __init__(self, cookies_file: Optional[str] = None, headless: Optional[bool] = None):
         """
         Initialize the PlaywrightDriver.
         
         Args:
             cookies_file: Path to a JSON file containing cookies for authentication.
+            headless: Run the browser without a window. If None, follows the
+                      HEADLESS_BROWSER setting (headless unless set to false,
+                      e.g. to watch a scrape while debugging).
         """
         self.cookies_file = cookies_file
+        self.headless = headless
         print(f"Initialized PlaywrightDriver with cookies_file: {self.cookies_file}")
         self.playwright = None
         self.browser = None
         
 
-    def initialize_driver(self, user_agent_type: str = "default") -> BrowserContext:
+    def initialize_driver(self, user_agent_type: str = "default",
+                          block_resources: bool = False) -> "BrowserContext":
         """
         Start the browser and initialize a new context.
         
         Args:
             user_agent_type: Type of user agent to use ("default", "random", or "mobile")
+            block_resources: If True, images, media, fonts and stylesheets are
+                             not loaded in the context
             
         Returns:
             A browser context object that can be used to create pages.
@@ -38,10 +221,38 @@ class PlaywrightDriver:
         Raises:
             Exception: If browser initialization fails.
         """
+        try:
+            self.launch_browser()
+            return self.new_context(user_agent_type, block_resources)
+            
+        except Exception as e:
+            logger.error(f"Failed to initialize Playwright driver: {str(e)}")
+            # Clean up partially initialized resources
+            self.close_resources()
+            raise
+    
+    def launch_browser(self) -> None:
+        """
+        Start Playwright and launch the browser, unless it is already running.
+        
+        Raises:
+            Exception: If the browser cannot be launched.
+        """
+        if self.browser is not None:
+            return
+        
+        # Imported here so that importing this module stays cheap
+        from playwright.sync_api import sync_playwright
+        
+        headless = self.headless
+        if headless is None:
+            from config.settings import HEADLESS_BROWSER
+            headless = HEADLESS_BROWSER
+        
         try:
             self.playwright = sync_playwright().start()
             self.browser = self.playwright.chromium.launch(
-                headless=True,
+                headless=headless,
                 args=[
                     '--disable-blink-features=AutomationControlled',  # Disable the AutomationControlled flag
                     '--no-sandbox',                                   # Useful for some environments
@@ -51,39 +262,76 @@ class PlaywrightDriver:
                     '--disable-gpu',                                  # Disables GPU hardware acceleration
                 ]
             )
-            
-            # Select a user agent based on the specified type
-            user_agent = self._get_user_agent(user_agent_type)
-            
-            # Create context with user agent
-            context = self.browser.new_context(
-                user_agent=user_agent,
-                viewport={'width': 1920, 'height': 1080},  # Default viewport
-                locale="en-US"
-            )
-            
-            # Additional context settings
-            context.set_default_timeout(60000)  # 60 seconds default timeout
-            
-            # Add cookies if provided
-            if self.cookies_file:
-                try:
-                    with open(self.cookies_file, 'r') as file:
-                        cookies = json.load(file)
-                        context.add_cookies(cookies)
-                        logger.info(f"Loaded cookies from {self.cookies_file}")
-                except (FileNotFoundError, json.JSONDecodeError) as e:
-                    logger.error(f"Failed to load cookies from {self.cookies_file}: {str(e)}")
-                    # Continue without cookies rather than failing completely
-            
-            return context
-            
-        except Exception as e:
-            logger.error(f"Failed to initialize Playwright driver: {str(e)}")
-            # Clean up partially initialized resources
+        except Exception:
             self.close_resources()
             raise
+    
+    def new_context(self, user_agent_type: str = "default",
+                    block_resources: bool = False) -> "BrowserContext":
+        """
+        Open a fresh context on the running browser, launching it if needed.
+        
+        Contexts share nothing (cookies, storage, cache), so a new context
+        gives the same clean slate as a new browser at a fraction of the cost.
+        Close it with ``context.close()`` when done; the browser stays up
+        until close() or close_resources() is called.
+        
+        Args:
+            user_agent_type: Type of user agent to use ("default", "random", or "mobile")
+            block_resources: If True, images, media, fonts and stylesheets are
+                             not loaded in the context
+            
+        Returns:
+            A browser context object that can be used to create pages.
+        """
+        self.launch_browser()
+        
+        if user_agent_type == "mobile":
+            # Emulate a whole device (viewport, pixel ratio, touch and user
+            # agent) from Playwright's descriptor table; a mobile user agent
+            # on a desktop viewport is easy to tell apart from a real phone
+            context_options = self._get_device_options(MOBILE_DEVICE)
+        else:
+            # Select a user agent based on the specified type
+            context_options = {
+                "user_agent": self._get_user_agent(user_agent_type),
+                "viewport": {'width': 1920, 'height': 1080},  # Default viewport
+            }
+        
+        context = self.browser.new_context(**context_options, locale="en-US")
+        
+        # Additional context settings
+        context.set_default_timeout(60000)  # 60 seconds default timeout
+        
+        if block_resources:
+            context.route("**/*", abort_heavy_resources)
+        
+        # Add cookies if provided
+        if self.cookies_file:
+            try:
+                context.add_cookies(_load_cookies(self.cookies_file))
+                logger.info(f"Loaded cookies from {self.cookies_file}")
+            except (FileNotFoundError, ValueError) as e:
+                logger.error(f"Failed to load cookies from {self.cookies_file}: {str(e)}")
+                # Continue without cookies rather than failing completely
+        
+        return context
 
+    def _get_device_options(self, device_name: str) -> Dict[str, Any]:
+        """
+        Get the new_context options that emulate a device.
+        
+        Args:
+            device_name: Name of a Playwright device descriptor, e.g. "Pixel 7"
+            
+        Returns:
+            The descriptor's context options (user agent, viewport, device
+            scale factor, touch and mobile flags)
+        """
+        descriptor = self.playwright.devices[device_name]
+        # The browser the device ships with is a launch choice, not a context option
+        return {key: value for key, value in descriptor.items() if key != "default_browser_type"}
+    
     def _get_user_agent(self, user_agent_type: str) -> str:
         """
         Get a user agent string based on the specified type.
@@ -94,45 +342,13 @@ class PlaywrightDriver:
         Returns:
             A user agent string
         """
-        # Default Chrome user agent
-        default_ua = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/123.0.0.0 Safari/537.36"
-        
-        # Collection of desktop user agents
-        desktop_uas = [
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/123.0.0.0 Safari/537.36",
-            "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.3 Safari/605.1.15",
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36 Edg/121.0.0.0",
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:109.0) Gecko/20100101 Firefox/115.0",
-            "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36",
-            "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36",
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36 OPR/108.0.0.0",
-        ]
-        
-        # Collection of mobile user agents
-        mobile_uas = [
-            "Mozilla/5.0 (iPhone; CPU iPhone OS 17_3 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.3 Mobile/15E148 Safari/604.1",
-            "Mozilla/5.0 (iPad; CPU OS 17_3 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.3 Mobile/15E148 Safari/604.1",
-            "Mozilla/5.0 (Linux; Android 13; SM-S901B) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.6261.90 Mobile Safari/537.36",
-            "Mozilla/5.0 (Linux; Android 13; SM-G998B) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.6261.90 Mobile Safari/537.36",
-            "Mozilla/5.0 (iPhone; CPU iPhone OS 17_3_1 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) CriOS/122.0.6261.89 Mobile/15E148 Safari/604.1",
-            "Mozilla/5.0 (Linux; Android 12; Pixel 6) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.6261.90 Mobile Safari/537.36",
-        ]
-        
-        if user_agent_type == "default":
-            return default_ua
-        elif user_agent_type == "random":
-            # Pick a random desktop user agent
-            import random
-            return random.choice(desktop_uas)
-        elif user_agent_type == "mobile":
-            # Pick a random mobile user agent
-            import random
-            return random.choice(mobile_uas)
-        else:
+        user_agents = USER_AGENTS_BY_TYPE.get(user_agent_type)
+        if user_agents is None:
             logger.warning(f"Unknown user agent type: {user_agent_type}, using default")
-            return default_ua
+            return DEFAULT_USER_AGENT
+        return random.choice(user_agents)
     
-    def close(self, context: BrowserContext) -> None:
+    def close(self, context: "BrowserContext") -> None:
         """
         Close the browser context and clean up resources.
         
@@ -155,4 +371,7 @@ class PlaywrightDriver:
             if self.playwright:
                 self.playwright.stop()
         except Exception as e:
-            logger.error(f"Error when closing Playwright resources: {str(e)}")
\ No newline at end of file
+            logger.error(f"Error when closing Playwright resources: {str(e)}")
+        finally:
+            self.browser = None
+            self.playwright = None
\ No newline at end of file
@@ -0,0 +1,130 @@
+"""
+Scraping helpers.
+
+Shared by the services that read follower counts out of page HTML.
+"""
+
+import codecs
+import logging
+from types import MappingProxyType
+from typing import Iterable, Optional, Pattern
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+# Headers for the plain HTTP fetch tried before launching a browser
+HTTP_HEADERS = MappingProxyType({
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/123.0.0.0 Safari/537.36"
+    ),
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.9",
+})
+HTTP_TIMEOUT = 15
+# Most of a response body fetch_html reads, and the size of each read
+HTTP_MAX_BYTES = 8 * 1024 * 1024
+HTTP_CHUNK_BYTES = 64 * 1024
+# How far back each new chunk is searched for stop_pattern, so a match split
+# across two chunks is still found
+_STOP_OVERLAP_CHARS = 256
+
+# One keep-alive connection pool for every plain fetch
+_session = requests.Session()
+_session.headers.update(HTTP_HEADERS)
+
+# What can sit between a count pattern's start and its literal marker: the
+# digits and separators of e.g. "441,469\n    followers", plus any
+# whitespace (str.isspace), which covers the non-breaking spaces a
+# pattern's \s may consume as well.
+_COUNT_PREFIX_CHARS = frozenset("0123456789,.")
+
+
+def anchored_scan_start(page_content: str, anchors: Iterable[str]) -> Optional[int]:
+    """
+    Find where a count regex needs to start scanning a page.
+
+    Every count pattern contains one of ``anchors`` literally, and str.find
+    locates them far faster than a regex scan. The start is the first anchor,
+    walked back over the digits and whitespace a pattern allows before it,
+    plus one character for a delimiter such as an opening quote.
+
+    Args:
+        page_content: HTML content of the page
+        anchors: Literals of which every match contains at least one
+
+    Returns:
+        The index to start the regex scan at, or None if no anchor occurs in
+        the page (so nothing can match)
+    """
+    positions = [i for i in map(page_content.find, anchors) if i >= 0]
+    if not positions:
+        return None
+
+    start = min(positions)
+    while start > 0 and (page_content[start - 1] in _COUNT_PREFIX_CHARS
+                         or page_content[start - 1].isspace()):
+        start -= 1
+    return max(0, start - 1)
+
+
+def fetch_html(url: str, stop_pattern: Optional[Pattern] = None,
+               stop_group: Optional[str] = None) -> Optional[str]:
+    """
+    Fetch a page's HTML without a browser.
+
+    The body is streamed and read up to HTTP_MAX_BYTES. With stop_pattern,
+    reading also stops as soon as the text so far holds a match of it (with
+    stop_group set, if given) that the next chunk can no longer extend.
+
+    Args:
+        url: URL of the page
+        stop_pattern: Regex whose match means the rest of the page isn't needed
+        stop_group: Group of stop_pattern that must have taken part in the match
+
+    Returns:
+        The page HTML read so far, or None if the request failed or was
+        refused (LinkedIn answers unrecognised clients with HTTP 999)
+    """
+    try:
+        with _session.get(url, timeout=HTTP_TIMEOUT, stream=True) as response:
+            if response.status_code != 200:
+                logger.info(f"HTTP fetch of {url} returned {response.status_code}; falling back to the browser")
+                return None
+
+            decoder = codecs.getincrementaldecoder(response.encoding or "utf-8")(errors="replace")
+            parts, tail, read_bytes = [], "", 0
+            for chunk in response.iter_content(HTTP_CHUNK_BYTES):
+                read_bytes += len(chunk)
+                text = decoder.decode(chunk)
+                parts.append(text)
+
+                if stop_pattern is not None:
+                    # Search the new text plus a little of what came before it
+                    tail = (tail + text)[-(len(text) + _STOP_OVERLAP_CHARS):]
+                    if _has_complete_match(tail, stop_pattern, stop_group):
+                        break
+                if read_bytes >= HTTP_MAX_BYTES:
+                    logger.info(f"HTTP fetch of {url} stopped at {read_bytes} bytes")
+                    break
+            else:
+                parts.append(decoder.decode(b"", final=True))
+    except requests.RequestException as e:
+        logger.info(f"HTTP fetch of {url} failed ({e}); falling back to the browser")
+        return None
+
+    return "".join(parts)
+
+
+def _has_complete_match(text: str, pattern: Pattern, group: Optional[str]) -> bool:
+    """
+    Check ``text`` for a match of ``pattern`` (with ``group`` set, if given).
+
+    A match running up to the very end of the text is ignored: its digits may
+    continue in the next chunk.
+    """
+    for match in pattern.finditer(text):
+        if match.end() < len(text) and (group is None or match.group(group) is not None):
+            return True
+    return False